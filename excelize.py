@@ -10,10 +10,11 @@ provided streaming API for generating or reading data from a worksheet with huge
 amounts of data. This library needs Python version 3.9 or later.
 """
 
-from dataclasses import fields
+from dataclasses import fields, is_dataclass
+from functools import lru_cache
 from datetime import datetime, date, time
 from enum import Enum
-from typing import Tuple, get_args, get_origin, List, Optional, Union
+from typing import Dict, Tuple, get_args, get_origin, List, Optional, Union
 import types_go
 from types_py import *
 from ctypes import (
@@ -84,8 +85,148 @@ def load_lib():
 
 lib = CDLL(os.path.join(os.path.dirname(__file__), load_lib()))
 ENCODE = "utf-8"
+_invalid_sheet_name_chars = frozenset(":\\/?*[]")
+
+# Return types of the exported functions, declared once at load time instead
+# of being assigned on every call.
+restypes = {
+    "AddChart": c_char_p,
+    "AddChartSheet": c_char_p,
+    "AddComment": c_char_p,
+    "AddFormControl": c_char_p,
+    "AddPicture": c_char_p,
+    "AddPictureFromBytes": c_char_p,
+    "AddPivotTable": c_char_p,
+    "AddShape": c_char_p,
+    "AddSlicer": c_char_p,
+    "AddSparkline": c_char_p,
+    "AddTable": c_char_p,
+    "AddVBAProject": c_char_p,
+    "AutoFilter": c_char_p,
+    "CalcCellValue": types_go._StringErrorResult,
+    "CellNameToCoordinates": types_go._CellNameToCoordinatesResult,
+    "Close": c_char_p,
+    "ColumnNameToNumber": types_go._IntErrorResult,
+    "ColumnNumberToName": types_go._StringErrorResult,
+    "CoordinatesToCellName": types_go._StringErrorResult,
+    "CopySheet": c_char_p,
+    "DeleteChart": c_char_p,
+    "DeleteComment": c_char_p,
+    "DeleteDefinedName": c_char_p,
+    "DeletePicture": c_char_p,
+    "DeleteSheet": c_char_p,
+    "DeleteSlicer": c_char_p,
+    "DuplicateRow": c_char_p,
+    "DuplicateRowTo": c_char_p,
+    "FreeBuffer": None,
+    "FreeStringArrayErrorResult": None,
+    "GetActiveSheetIndex": c_int,
+    "GetAppProps": types_go._GetAppPropsResult,
+    "GetCellFormula": types_go._StringErrorResult,
+    "GetCellHyperLink": types_go._GetCellHyperLinkResult,
+    "GetCellRichText": types_go._GetCellRichTextResult,
+    "GetCellStyle": types_go._IntErrorResult,
+    "GetCellValue": types_go._StringErrorResult,
+    "GetColStyle": types_go._IntErrorResult,
+    "GetColVisible": types_go._BoolErrorResult,
+    "GetDefaultFont": types_go._StringErrorResult,
+    "GetRowVisible": types_go._BoolErrorResult,
+    "GetRows": types_go._GetRowsResult,
+    "GetSheetDimension": types_go._StringErrorResult,
+    "GetSheetIndex": types_go._IntErrorResult,
+    "GetStyle": types_go._GetStyleResult,
+    "GetTables": types_go._GetTablesResult,
+    "GetWorkbookProps": types_go._GetWorkbookPropsResult,
+    "InsertCols": c_char_p,
+    "InsertRows": c_char_p,
+    "MergeCell": c_char_p,
+    "MoveSheet": c_char_p,
+    "NewConditionalStyle": types_go._IntErrorResult,
+    "NewFile": c_int,
+    "NewSheet": types_go._IntErrorResult,
+    "NewStreamWriter": types_go._IntErrorResult,
+    "NewStyle": types_go._IntErrorResult,
+    "OpenFile": types_go._IntErrorResult,
+    "OpenReader": types_go._IntErrorResult,
+    "ProtectSheet": c_char_p,
+    "ProtectWorkbook": c_char_p,
+    "RemoveCol": c_char_p,
+    "RemovePageBreak": c_char_p,
+    "RemoveRow": c_char_p,
+    "Rows": types_go._IntErrorResult,
+    "RowsClose": c_char_p,
+    "RowsColumns": types_go._StringArrayErrorResult,
+    "RowsError": c_char_p,
+    "RowsNext": c_bool,
+    "Save": c_char_p,
+    "SaveAs": c_char_p,
+    "SearchSheet": types_go._StringArrayErrorResult,
+    "SetActiveSheet": c_char_p,
+    "SetCellBool": c_char_p,
+    "SetCellFormula": c_char_p,
+    "SetCellHyperLink": c_char_p,
+    "SetCellInt": c_char_p,
+    "SetCellRichText": c_char_p,
+    "SetCellStr": c_char_p,
+    "SetCellStyle": c_char_p,
+    "SetCellValue": c_char_p,
+    "SetCellValues": c_char_p,
+    "SetColOutlineLevel": c_char_p,
+    "SetColStyle": c_char_p,
+    "SetColVisible": c_char_p,
+    "SetColWidth": c_char_p,
+    "SetConditionalFormat": c_char_p,
+    "SetDefaultFont": c_char_p,
+    "SetDefinedName": c_char_p,
+    "SetDocProps": c_char_p,
+    "SetHeaderFooter": c_char_p,
+    "SetPageLayout": c_char_p,
+    "SetPageMargins": c_char_p,
+    "SetPanes": c_char_p,
+    "SetRowHeight": c_char_p,
+    "SetRowOutlineLevel": c_char_p,
+    "SetRowStyle": c_char_p,
+    "SetRowVisible": c_char_p,
+    "SetSheetBackground": c_char_p,
+    "SetSheetBackgroundFromBytes": c_char_p,
+    "SetSheetCol": c_char_p,
+    "SetSheetDimension": c_char_p,
+    "SetSheetName": c_char_p,
+    "SetSheetProps": c_char_p,
+    "SetSheetRow": c_char_p,
+    "SetSheetView": c_char_p,
+    "SetSheetVisible": c_char_p,
+    "SetWorkbookProps": c_char_p,
+    "StreamAddTable": c_char_p,
+    "StreamFlush": c_char_p,
+    "StreamInsertPageBreak": c_char_p,
+    "StreamMergeCell": c_char_p,
+    "StreamSetColWidth": c_char_p,
+    "StreamSetPanes": c_char_p,
+    "StreamSetRow": c_char_p,
+    "UngroupSheets": c_char_p,
+    "UnmergeCell": c_char_p,
+    "UpdateLinkedValue": c_char_p,
+    "WriteToBuffer": types_go._BytesErrorResult,
+}
+for name, restype in restypes.items():
+    getattr(lib, name).restype = restype
+del name, restype
 __version__ = "0.0.3"
 uppercase_words = ["id", "rgb", "sq", "xml"]
+# interface_mappings defined functions mapping for Python basic data types
+# value to the C interface, the fields of the C structure are assigned directly
+# to avoid converting an intermediate Interface object field by field.
+interface_mappings = {
+    int: lambda v: types_go._Interface(Type=1, Integer=v),
+    str: lambda v: types_go._Interface(Type=2, String=v.encode(ENCODE)),
+    float: lambda v: types_go._Interface(Type=3, Float64=v),
+    bool: lambda v: types_go._Interface(Type=4, Boolean=v),
+    datetime: lambda v: types_go._Interface(Type=5, Integer=int(v.timestamp())),
+    date: lambda v: types_go._Interface(
+        Type=5, Integer=int(datetime.combine(v, time.min).timestamp())
+    ),
+}
 
 
 def py_to_base_ctype(py_value, c_type):
@@ -104,6 +245,81 @@ def py_to_base_ctype(py_value, c_type):
     )
 
 
+def _freeze(value):
+    """
+    Build a hashable key from a value of the Python data types, nested data
+    classes, lists and tuples are converted to tuples recursively.
+
+    Args:
+        value: The value of the Python data types.
+
+    Returns:
+        A hashable value which equals to the key of another value with the same
+        type and contents.
+    """
+    if is_dataclass(value) and not isinstance(value, type):
+        return (type(value),) + tuple(
+            _freeze(getattr(value, field.name)) for field in fields(value)
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _check_sheet_name(sheet: str) -> str:
+    """
+    Check the worksheet name length and characters in the same order as the
+    library does. Names that start or end with a single quote are left for the
+    library to check.
+
+    Args:
+        sheet (str): The worksheet name
+
+    Returns:
+        str: The error message if the worksheet name is invalid, otherwise an
+        empty string.
+    """
+    if len(sheet) > 31:
+        return "the sheet name length exceeds the 31 characters limit"
+    if sheet.startswith("'") or sheet.endswith("'"):
+        return ""
+    if not _invalid_sheet_name_chars.isdisjoint(sheet):
+        return "the sheet can not contain any of the characters :\\/?*[or]"
+    return ""
+
+
+def py_bytes_to_c(buffer) -> Tuple[POINTER(c_ubyte), int]:
+    """
+    Get a pointer to the contents of a bytes-like object for passing it to the
+    library. The bytes object and writable C-contiguous buffers (bytearray,
+    memoryview, mmap, etc.) are passed without copying the contents, other
+    read-only or non-contiguous buffers will be copied once.
+
+    Args:
+        buffer: The bytes-like object.
+
+    Returns:
+        Tuple[POINTER(c_ubyte), int]: A tuple containing the pointer to the
+        contents and the length of the contents in bytes.
+    """
+    if type(buffer) is bytes:
+        return cast(buffer, POINTER(c_ubyte)), len(buffer)
+    view = memoryview(buffer)
+    if not view.c_contiguous:
+        # Copy the non-contiguous view, for example: memoryview(buf)[::2], the
+        # c_char_p keeps the copied bytes alive with the returned pointer
+        contents = view.tobytes()
+        return cast(c_char_p(contents), POINTER(c_ubyte)), len(contents)
+    view = view.cast("B")
+    if not view.readonly:
+        c_array = (c_ubyte * view.nbytes).from_buffer(view)
+    elif type(view.obj) is bytes and view.nbytes == len(view.obj):
+        return cast(view.obj, POINTER(c_ubyte)), view.nbytes
+    else:
+        c_array = (c_ubyte * view.nbytes).from_buffer_copy(view)
+    return cast(c_array, POINTER(c_ubyte)), view.nbytes
+
+
 def is_py_primitive_type(t: type) -> bool:
     """
     Check if the given type is a Python primitive type.
@@ -133,6 +349,73 @@ def snake_to_pascal(snake_str: str) -> str:
     )
 
 
+# Field kinds of the Python data type, resolved by the 'struct_fields' function.
+FIELD_BASE = 0  # The Go base type, for example: string
+FIELD_STRUCT = 1  # The Go struct, for example: excelize.Options
+FIELD_PTR_BASE = 2  # Pointer of the Go basic data type, for example: *string
+FIELD_PTR_STRUCT = 3  # Pointer of the Go struct, for example: *excelize.Options
+FIELD_BYTES = 4  # The Go bytes array: []byte
+FIELD_ARRAY_BASE = 5  # The Go basic data type array, for example: []string
+FIELD_ARRAY_STRUCT = 6  # The Go struct array, for example: []excelize.Options
+FIELD_PTR_ARRAY_BASE = 7  # Pointer array of the Go basic data type: []*string
+FIELD_PTR_ARRAY_STRUCT = 8  # Pointer array of the Go struct: []*excelize.Options
+
+
+@lru_cache(maxsize=None)
+def struct_fields(py_type: type) -> Tuple[Tuple[str, str, int, type], ...]:
+    """
+    Resolve the fields mapping between the given Python data type and the
+    corresponding C structure. The result is cached for each data type, so the
+    type hints of the fields are only inspected once.
+
+    Args:
+        py_type (type): The Python data type.
+
+    Returns:
+        Tuple[Tuple[str, str, int, type], ...]: A tuple of the Python field
+        name, the C field name, the field kind and the Python type of the
+        field value, the type of the elements for the array fields.
+    """
+    specs = []
+    for py_field in fields(py_type):
+        py_field_args = get_args(py_field.type)
+        if type(None) not in py_field_args:
+            if is_py_primitive_type(py_field.type):
+                kind, value_type = FIELD_BASE, py_field.type
+            else:
+                kind, value_type = FIELD_STRUCT, py_field.type
+        else:
+            arg_type = py_field_args[0]
+            if arg_type is bytes:
+                kind, value_type = FIELD_BYTES, bytes
+            elif get_origin(arg_type) is not list:
+                if any(is_py_primitive_type(arg) for arg in py_field_args):
+                    kind = FIELD_PTR_BASE
+                    value_type = str if str in py_field_args else arg_type
+                else:
+                    kind, value_type = FIELD_PTR_STRUCT, arg_type
+            else:
+                py_field_type = get_args(arg_type)[0]
+                if type(None) not in get_args(py_field_type):
+                    value_type = py_field_type
+                    kind = (
+                        FIELD_ARRAY_BASE
+                        if is_py_primitive_type(value_type)
+                        else FIELD_ARRAY_STRUCT
+                    )
+                else:
+                    value_type = get_args(py_field_type)[0]
+                    kind = (
+                        FIELD_PTR_ARRAY_BASE
+                        if is_py_primitive_type(value_type)
+                        else FIELD_PTR_ARRAY_STRUCT
+                    )
+        specs.append(
+            (py_field.name, snake_to_pascal(py_field.name), kind, value_type)
+        )
+    return tuple(specs)
+
+
 def c_value_to_py(ctypes_instance, py_instance):
     """
     Convert a ctypes instance to a Python instance by mapping fields from the
@@ -147,113 +430,104 @@ def c_value_to_py(ctypes_instance, py_instance):
     """
     if ctypes_instance is None:
         return None
-    for py_field in fields(py_instance):
-        py_field_name = py_field.name
-        c_field_name = snake_to_pascal(py_field.name)
-        # The Go base type
-        py_field_args = get_args(py_field.type)
-
-        if type(None) not in py_field_args:
-            if is_py_primitive_type(py_field.type):
-                c_val = getattr(ctypes_instance, c_field_name)
-                if c_val:
-                    setattr(
-                        py_instance,
-                        py_field_name,
-                        (c_val.decode(ENCODE) if str is py_field.type else c_val),
-                    )
-                    continue
-            else:
-                # The Go struct, for example: excelize.Options, convert sub fields recursively
+    for py_field_name, c_field_name, kind, py_type in struct_fields(
+        type(py_instance)
+    ):
+        if kind == FIELD_BASE:
+            # The Go base type
+            c_val = getattr(ctypes_instance, c_field_name)
+            if c_val:
+                setattr(
+                    py_instance,
+                    py_field_name,
+                    (c_val.decode(ENCODE) if str is py_type else c_val),
+                )
+        elif kind == FIELD_STRUCT:
+            # The Go struct, for example: excelize.Options, convert sub fields recursively
+            setattr(
+                py_instance,
+                py_field_name,
+                c_value_to_py(getattr(ctypes_instance, c_field_name), py_type()),
+            )
+        elif kind in (FIELD_PTR_BASE, FIELD_BYTES):
+            # Pointer of the Go basic data type, for example: *string
+            value = getattr(ctypes_instance, c_field_name)
+            if value:
                 setattr(
                     py_instance,
                     py_field_name,
-                    c_value_to_py(
-                        getattr(ctypes_instance, c_field_name), py_field.type()
+                    (
+                        value.contents.value.decode(ENCODE)
+                        if str is py_type
+                        else value.contents.value
                     ),
                 )
+        elif kind == FIELD_PTR_STRUCT:
+            # Pointer of the Go struct, for example: *excelize.Options
+            value = getattr(ctypes_instance, c_field_name)
+            if value:
+                setattr(
+                    py_instance,
+                    py_field_name,
+                    c_value_to_py(value.contents, py_type()),
+                )
         else:
-            if get_origin(py_field_args[0]) is not list:
-                # Pointer of the Go data type, for example: *excelize.Options or *string
-                value = getattr(ctypes_instance, c_field_name)
-                if value:
-                    if any(is_py_primitive_type(arg) for arg in py_field_args):
-                        # Pointer of the Go basic data type, for example: *string
-                        setattr(
-                            py_instance,
-                            py_field_name,
-                            (
-                                value.contents.value.decode(ENCODE)
-                                if str in py_field_args
-                                else value.contents.value
-                            ),
-                        )
-                    else:
-                        # Pointer of the Go struct, for example: *excelize.Options
-                        setattr(
-                            py_instance,
-                            py_field_name,
-                            c_value_to_py(
-                                value.contents,
-                                py_field_args[0](),
-                            ),
+            # The Go data type array, for example:
+            # []*excelize.Options, []excelize.Options, []string, []*string
+            py_list = []
+            l = getattr(ctypes_instance, c_field_name + "Len")
+            c_array = getattr(ctypes_instance, c_field_name)
+            if c_array:
+                if kind == FIELD_ARRAY_BASE:
+                    # The Go basic data type array, for example: []string
+                    for i in range(l):
+                        py_list.append(
+                            string_at(c_array[i]).decode(ENCODE)
+                            if str is py_type
+                            else c_array[i]
                         )
-            else:
-                # The Go data type array, for example:
-                # []*excelize.Options, []excelize.Options, []string, []*string
-                if type(None) not in get_args(get_args(py_field_args[0])[0]):
-                    # The Go data type array, for example: []excelize.Options or []string
-                    py_list = []
-                    l = getattr(ctypes_instance, c_field_name + "Len")
-                    c_array = getattr(ctypes_instance, c_field_name)
-                    if c_array:
-                        if is_py_primitive_type(get_args(py_field_args[0])[0]):
-                            # The Go basic data type array, for example: []string
-                            for i in range(l):
-                                py_list.append(
-                                    string_at(c_array[i]).decode(ENCODE)
-                                    if str is get_args(py_field_args[0])[0]
-                                    else c_array[i]
-                                )
+                elif kind == FIELD_ARRAY_STRUCT:
+                    # The Go struct array, for example: []excelize.Options
+                    for i in range(l):
+                        py_list.append(c_value_to_py(c_array[i], py_type()))
+                elif kind == FIELD_PTR_ARRAY_BASE:
+                    # Pointer array of the Go basic data type, for example: []*string,
+                    # NULL pointers are converted to None
+                    for i in range(l):
+                        if not c_array[i]:
+                            py_list.append(None)
+                        elif str is py_type:
+                            py_list.append(string_at(c_array[i]).decode(ENCODE))
                         else:
-                            # The Go struct array, for example: []excelize.Options
-                            for i in range(l):
-                                py_list.append(
-                                    c_value_to_py(
-                                        c_array[i],
-                                        get_args(py_field_args[0])[0](),
-                                    ),
-                                )
-                        setattr(py_instance, py_field_name, py_list)
+                            py_list.append(c_array[i].contents.value)
                 else:
-                    # Pointer array of the Go data type, for example: []*excelize.Options or []*string
-                    py_list = []
-                    l = getattr(ctypes_instance, c_field_name + "Len")
-                    c_array = getattr(ctypes_instance, c_field_name)
-                    if c_array:
-                        if is_py_primitive_type(
-                            get_args(get_args(py_field_args[0])[0])[0]
-                        ):
-                            # Pointer array of the Go basic data type, for example: []*string
-                            for i in range(l):
-                                py_list.append(
-                                    string_at(c_array[i]).decode(ENCODE)
-                                    if str is get_args(get_args(py_field_args[0])[0])[0]
-                                    else c_array[i].contents.value
-                                )
-                        else:
-                            #  Pointer array of the Go struct, for example: []*excelize.Options
-                            for i in range(l):
-                                py_list.append(
-                                    c_value_to_py(
-                                        c_array[i].contents,
-                                        get_args(get_args(py_field_args[0])[0])[0](),
-                                    ),
-                                )
-                        setattr(py_instance, py_field_name, py_list)
+                    #  Pointer array of the Go struct, for example: []*excelize.Options,
+                    #  NULL pointers are converted to None
+                    for i in range(l):
+                        py_list.append(
+                            c_value_to_py(c_array[i].contents, py_type())
+                            if c_array[i]
+                            else None
+                        )
+                setattr(py_instance, py_field_name, py_list)
     return py_instance
 
 
+@lru_cache(maxsize=None)
+def c_field_types(struct: type) -> Dict[str, type]:
+    """
+    Retrieve the types of all fields of a C structure. The result is cached for
+    each structure type.
+
+    Args:
+        struct (type): The C structure type.
+
+    Returns:
+        Dict[str, type]: A dictionary mapping field names to field types.
+    """
+    return {field[0]: field[1] for field in struct._fields_}
+
+
 def get_c_field_type(struct, field_name):
     """
     Retrieve the type of a specified field from a C structure.
@@ -265,9 +539,7 @@ def get_c_field_type(struct, field_name):
     Returns:
         type: The type of the specified field if found, otherwise None.
     """
-    for field in struct._fields_:
-        if field[0] == field_name:
-            return field[1]
+    return c_field_types(type(struct)).get(field_name)
 
 
 def py_value_to_c(py_instance, ctypes_instance):
@@ -289,124 +561,114 @@ def py_value_to_c(py_instance, ctypes_instance):
     """
     if py_instance is None:
         return None
-    for py_field in fields(py_instance):
-        py_field_name = py_field.name
-        c_field_name = snake_to_pascal(py_field.name)
-        # The Go base type
-        py_field_args = get_args(py_field.type)
-
-        if type(None) not in py_field_args:
-            if is_py_primitive_type(py_field.type):
-                if hasattr(py_instance, py_field_name):
-                    c_type = get_c_field_type(ctypes_instance, c_field_name)
-                    setattr(
-                        ctypes_instance,
-                        c_field_name,
-                        py_to_base_ctype(getattr(py_instance, py_field_name), c_type),
-                    )
-                    continue
-            else:
-                # The Go struct, for example: excelize.Options, convert sub fields recursively
-                c_type = get_c_field_type(ctypes_instance, c_field_name)
-                if hasattr(py_instance, py_field_name):
-                    setattr(
-                        ctypes_instance,
-                        c_field_name,
-                        py_value_to_c(getattr(py_instance, py_field_name), c_type()),
-                    )
+    if isinstance(py_instance, type):
+        # Class defaults such as 'fill: Fill = Fill' stand for an instance with
+        # the default field values
+        py_instance = py_instance()
+    c_types = c_field_types(type(ctypes_instance))
+    for py_field_name, c_field_name, kind, py_type in struct_fields(
+        type(py_instance)
+    ):
+        if kind == FIELD_BASE:
+            # The Go base type
+            if hasattr(py_instance, py_field_name):
+                setattr(
+                    ctypes_instance,
+                    c_field_name,
+                    py_to_base_ctype(
+                        getattr(py_instance, py_field_name), c_types[c_field_name]
+                    ),
+                )
+        elif kind == FIELD_STRUCT:
+            # The Go struct, for example: excelize.Options, convert sub fields recursively
+            if hasattr(py_instance, py_field_name):
+                setattr(
+                    ctypes_instance,
+                    c_field_name,
+                    py_value_to_c(
+                        getattr(py_instance, py_field_name), c_types[c_field_name]()
+                    ),
+                )
+        elif kind == FIELD_PTR_BASE:
+            # Pointer of the Go basic data type, for example: *string
+            value = getattr(py_instance, py_field_name)
+            if value is not None:
+                setattr(
+                    ctypes_instance,
+                    c_field_name,
+                    pointer(py_to_base_ctype(value, c_types[c_field_name]._type_)),
+                )
+        elif kind == FIELD_PTR_STRUCT:
+            # Pointer of the Go struct, for example: *excelize.Options
+            value = getattr(py_instance, py_field_name)
+            if value is not None:
+                setattr(
+                    ctypes_instance,
+                    c_field_name,
+                    pointer(py_value_to_c(value, c_types[c_field_name]._type_())),
+                )
+        elif kind == FIELD_BYTES:
+            # The Go bytes array: []byte
+            value = getattr(py_instance, py_field_name)
+            if value is not None:
+                buf, l = py_bytes_to_c(value)
+                ctypes_instance.__setattr__(c_field_name, buf)
+                ctypes_instance.__setattr__(c_field_name + "Len", c_int(l))
         else:
-            arg_type = py_field_args[0]
-            if get_origin(arg_type) is not list and arg_type is not bytes:
-                # Pointer of the Go data type, for example: *excelize.Options or *string
-                value = getattr(py_instance, py_field_name)
-                c_type = get_c_field_type(ctypes_instance, c_field_name)._type_
-                if value is not None:
-                    if any(is_py_primitive_type(arg) for arg in py_field_args):
-                        # Pointer of the Go basic data type, for example: *string
-                        setattr(
-                            ctypes_instance,
-                            c_field_name,
-                            pointer(py_to_base_ctype(value, c_type)),
-                        )
-                    else:
-                        # Pointer of the Go struct, for example: *excelize.Options
-                        setattr(
-                            ctypes_instance,
-                            c_field_name,
-                            pointer(py_value_to_c(value, c_type())),
-                        )
+            # The Go data type array, for example:
+            # []*excelize.Options, []excelize.Options, []string, []*string
+            py_list = getattr(py_instance, py_field_name)
+            if not py_list:
+                continue
+            l = len(py_list)
+            if kind == FIELD_ARRAY_BASE and str is py_type:
+                # The Go string array: []string
+                c_array_type = POINTER(c_char) * l
+                ctypes_instance.__setattr__(
+                    c_field_name,
+                    c_array_type(
+                        *[create_string_buffer(c.encode(ENCODE)) for c in py_list]
+                    ),
+                )
+            elif kind == FIELD_ARRAY_BASE:
+                # The Go basic data type array, for example: []int
+                c_type = c_types[c_field_name]._type_
+                c_array = (c_type * l)()
+                for i in range(l):
+                    c_array.__setitem__(i, py_to_base_ctype(py_list[i], c_type))
+                ctypes_instance.__setattr__(c_field_name, c_array)
+            elif kind == FIELD_ARRAY_STRUCT:
+                # The Go struct array, for example: []excelize.Options, the
+                # elements are converted in place in the array
+                c_array = (c_types[c_field_name]._type_ * l)()
+                for i in range(l):
+                    py_value_to_c(py_list[i], c_array[i])
+                ctypes_instance.__setattr__(c_field_name, c_array)
             else:
-                # The Go data type array, for example:
-                # []*excelize.Options, []excelize.Options, []string, []*string
-                if arg_type is bytes:  # []byte
-                    c_type = get_c_field_type(ctypes_instance, c_field_name)._type_
-                    value = getattr(py_instance, py_field_name)
-                    ctypes_instance.__setattr__(
-                        c_field_name, cast(value, POINTER(c_ubyte))
-                    )
-                    ctypes_instance.__setattr__(c_field_name + "Len", c_int(len(value)))
-                    continue
-                py_field_type = get_args(arg_type)[0]
-                if type(None) not in get_args(py_field_type):
-                    # The Go data type array, for example: []excelize.Options or []string
-                    c_type = get_c_field_type(ctypes_instance, c_field_name)._type_
-                    py_list = getattr(py_instance, py_field_name)
-                    if py_list:
-                        l = len(py_list)
-                        c_array = (c_type * l)()
-                        if is_py_primitive_type(py_field_type):
-                            # The Go basic data type array, for example: []string
-                            if str is py_field_type:
-                                c_array_type = POINTER(c_char) * l
-                                ctypes_instance.__setattr__(
-                                    c_field_name,
-                                    c_array_type(
-                                        *[
-                                            create_string_buffer(c.encode(ENCODE))
-                                            for c in py_list
-                                        ]
-                                    ),
-                                )
-                            else:
-                                for i in range(l):
-                                    c_array.__setitem__(
-                                        i, py_to_base_ctype(py_list[i], c_type)
-                                    )
-                                ctypes_instance.__setattr__(c_field_name, c_array)
-                        else:
-                            # The Go struct array, for example: []excelize.Options
-                            for i in range(l):
-                                c_array.__setitem__(
-                                    i, py_value_to_c(py_list[i], c_type())
-                                )
-                            ctypes_instance.__setattr__(c_field_name, c_array)
-                        ctypes_instance.__setattr__(c_field_name + "Len", c_int(l))
-
+                # Pointer array of the Go data type, for example: []*excelize.Options or []*string
+                # None elements are passed as NULL pointers
+                c_type = c_types[c_field_name]._type_._type_
+                c_array = (POINTER(c_type) * l)()
+                if kind == FIELD_PTR_ARRAY_BASE:
+                    # Pointer array of the Go basic data type, for example: []*string
+                    for i in range(l):
+                        if py_list[i] is not None:
+                            c_array.__setitem__(
+                                i,
+                                pointer(py_to_base_ctype(py_list[i], c_type)),
+                            )
                 else:
-                    # Pointer array of the Go data type, for example: []*excelize.Options or []*string
-                    c_type = get_c_field_type(
-                        ctypes_instance, c_field_name
-                    )._type_._type_
-                    py_list = getattr(py_instance, py_field_name)
-                    if py_list:
-                        l = len(py_list)
-                        c_array = (POINTER(c_type) * l)()
-                        if is_py_primitive_type(get_args(py_field_type)[0]):
-                            # Pointer array of the Go basic data type, for example: []*string
-                            for i in range(l):
-                                c_array.__setitem__(
-                                    i,
-                                    pointer(py_to_base_ctype(py_list[i], c_type)),
-                                )
-                        else:
-                            #  Pointer array of the Go struct, for example: []*excelize.Options
-                            for i in range(l):
-                                c_array.__setitem__(
-                                    i,
-                                    pointer(py_value_to_c(py_list[i], c_type())),
-                                )
-                        ctypes_instance.__setattr__(c_field_name + "Len", c_int(l))
-                        ctypes_instance.__setattr__(c_field_name, c_array)
+                    #  Pointer array of the Go struct, for example: []*excelize.Options,
+                    #  the structs are converted in place in one contiguous array
+                    c_values = (c_type * l)()
+                    for i in range(l):
+                        if py_list[i] is not None:
+                            c_array.__setitem__(
+                                i,
+                                pointer(py_value_to_c(py_list[i], c_values[i])),
+                            )
+                ctypes_instance.__setattr__(c_field_name, c_array)
+            ctypes_instance.__setattr__(c_field_name + "Len", c_int(l))
     return ctypes_instance
 
 
@@ -423,19 +685,74 @@ def py_value_to_c_interface(py_value):
     Raises:
         TypeError: If the type of py_value is not supported.
     """
-    type_mappings = {
-        int: lambda: Interface(type=1, integer=py_value),
-        str: lambda: Interface(type=2, string=py_value),
-        float: lambda: Interface(type=3, float64=py_value),
-        bool: lambda: Interface(type=4, boolean=py_value),
-        datetime: lambda: Interface(type=5, integer=int(py_value.timestamp())),
-        date: lambda: Interface(
-            type=5,
-            integer=int(datetime.combine(py_value, time.min).timestamp()),
-        ),
-    }
-    interface = type_mappings.get(type(py_value), lambda: Interface())()
-    return py_value_to_c(interface, types_go._Interface())
+    return interface_mappings.get(type(py_value), lambda _: types_go._Interface())(
+        py_value
+    )
+
+
+class Rows:
+    rows_index: int
+
+    def __init__(self, rows_index: int):
+        self.rows_index = rows_index
+
+    def close(self) -> Optional[Exception]:
+        """
+        Closes the open worksheet XML file in the system temporary directory.
+
+        Returns:
+            Optional[Exception]: Returns None if no error occurred,
+            otherwise returns an Exception with the message.
+        """
+        err = lib.RowsClose(self.rows_index).decode(ENCODE)
+        return None if err == "" else Exception(err)
+
+    def columns(self, *opts: Options) -> Tuple[List[str], Optional[Exception]]:
+        """
+        Return the current row's column values. This fetches the worksheet data
+        as a stream, returns each cell in a row as is, and will not skip empty
+        rows in the tail of the worksheet.
+
+        Args:
+            *opts (Options): Optional parameters for get column cells value
+
+        Returns:
+            Tuple[List[str], Optional[Exception]]: A tuple containing the cell
+            values of the current row and an exception if an error occurred,
+            otherwise None.
+        """
+        options = (
+            byref(py_value_to_c(opts[0], types_go._Options()))
+            if opts
+            else POINTER(types_go._Options)()
+        )
+        res = lib.RowsColumns(self.rows_index, options)
+        arr = c_value_to_py(res, StringArrayErrorResult()).arr
+        err = res.Err.decode(ENCODE)
+        # Release the row right after decoding it, so reading the rows holds
+        # only one row of the worksheet in the C heap at a time.
+        lib.FreeStringArrayErrorResult(byref(res))
+        return arr if arr else [], None if err == "" else Exception(err)
+
+    def error(self) -> Optional[Exception]:
+        """
+        Return the error when the error occurs.
+
+        Returns:
+            Optional[Exception]: Returns None if no error occurred,
+            otherwise returns an Exception with the message.
+        """
+        err = lib.RowsError(self.rows_index).decode(ENCODE)
+        return None if err == "" else Exception(err)
+
+    def next(self) -> bool:
+        """
+        Will return True if find the next row element.
+
+        Returns:
+            bool: Returns True if find the next row element, otherwise False.
+        """
+        return lib.RowsNext(self.rows_index)
 
 
 class StreamWriter:
@@ -468,7 +785,6 @@ class StreamWriter:
 
             err = sw.add_table(excelize.Table(range="A1:D5"))
         """
-        lib.StreamAddTable.restype = c_char_p
         options = py_value_to_c(table, types_go._Table())
         err = lib.StreamAddTable(self.sw_index, byref(options)).decode(ENCODE)
         return None if err == "" else Exception(err)
@@ -487,7 +803,6 @@ class StreamWriter:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        lib.StreamInsertPageBreak.restype = c_char_p
         err = lib.StreamInsertPageBreak(self.sw_index, cell.encode(ENCODE)).decode(
             ENCODE
         )
@@ -508,7 +823,6 @@ class StreamWriter:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        lib.StreamMergeCell.restype = c_char_p
         err = lib.StreamMergeCell(
             self.sw_index,
             top_left_cell.encode(ENCODE),
@@ -540,7 +854,6 @@ class StreamWriter:
 
             err = sw.set_col_width(2, 3, 20)
         """
-        lib.StreamSetColWidth.restype = c_char_p
         err = lib.StreamSetColWidth(
             self.sw_index, c_int(start_col), c_int(end_col), c_double(width)
         ).decode(ENCODE)
@@ -559,7 +872,6 @@ class StreamWriter:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        lib.StreamSetPanes.restype = c_char_p
         options = py_value_to_c(opts, types_go._Panes())
         err = lib.StreamSetPanes(self.sw_index, byref(options)).decode(ENCODE)
         return None if err == "" else Exception(err)
@@ -583,7 +895,6 @@ class StreamWriter:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        lib.StreamSetRow.restype = c_char_p
         vals = (types_go._Interface * len(values))()
         for i, value in enumerate(values):
             vals[i] = py_value_to_c_interface(value)
@@ -603,7 +914,6 @@ class StreamWriter:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        lib.StreamFlush.restype = c_char_p
         err = lib.StreamFlush(self.sw_index).decode(ENCODE)
         return None if err == "" else Exception(err)
 
@@ -613,6 +923,8 @@ class File:
 
     def __init__(self, file_index: int):
         self.file_index = file_index
+        self._closed = False
+        self._style_ids: Dict[tuple, int] = {}
 
     def save(self, *opts: Options) -> Optional[Exception]:
         """
@@ -625,7 +937,6 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        err, lib.Save.restype = None, c_char_p
         options = POINTER(types_go._Options)()
         options = (
             byref(py_value_to_c(opts[0], types_go._Options()))
@@ -647,7 +958,6 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        lib.SaveAs.restype = c_char_p
         options = (
             byref(py_value_to_c(opts[0], types_go._Options()))
             if opts
@@ -675,7 +985,6 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        lib.AddChart.restype = c_char_p
         opts = [chart] + list(combo.values())
         charts = (types_go._Chart * len(opts))()
         for i, opt in enumerate(opts):
@@ -706,7 +1015,6 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        lib.AddChartSheet.restype = c_char_p
         opts = [chart] + list(combo.values())
         charts = (types_go._Chart * len(opts))()
         for i, opt in enumerate(opts):
@@ -733,7 +1041,6 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        lib.AddComment.restype = c_char_p
         options = py_value_to_c(opts, types_go._Comment())
         err = lib.AddComment(
             self.file_index, sheet.encode(ENCODE), byref(options)
@@ -756,7 +1063,6 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        lib.AddFormControl.restype = c_char_p
         options = py_value_to_c(opts, types_go._FormControl())
         err = lib.AddFormControl(
             self.file_index, sheet.encode(ENCODE), byref(options)
@@ -782,7 +1088,6 @@ class File:
             Optional[GraphicOptions]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        lib.AddPicture.restype = c_char_p
         options = (
             byref(py_value_to_c(opts, types_go._GraphicOptions()))
             if opts
@@ -818,7 +1123,6 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        lib.AddPictureFromBytes.restype = c_char_p
         err = lib.AddPictureFromBytes(
             self.file_index,
             sheet.encode(ENCODE),
@@ -909,7 +1213,6 @@ class File:
             if err:
                 print(err)
         """
-        lib.AddPivotTable.restype = c_char_p
         err = lib.AddPivotTable(
             self.file_index,
             byref(py_value_to_c(opts, types_go._PivotTableOptions())),
@@ -976,7 +1279,6 @@ class File:
             if err:
                 print(err)
         """
-        lib.AddShape.restype = c_char_p
         options = py_value_to_c(opts, types_go._Shape())
         err = lib.AddShape(
             self.file_index, sheet.encode(ENCODE), byref(options)
@@ -1014,7 +1316,6 @@ class File:
                 ),
             )
         """
-        lib.AddSlicer.restype = c_char_p
         options = py_value_to_c(opts, types_go._SlicerOptions())
         err = lib.AddSlicer(
             self.file_index, sheet.encode(ENCODE), byref(options)
@@ -1052,7 +1353,6 @@ class File:
                 ),
             )
         """
-        lib.AddSparkline.restype = c_char_p
         options = py_value_to_c(opts, types_go._SparklineOptions())
         err = lib.AddSparkline(
             self.file_index, sheet.encode(ENCODE), byref(options)
@@ -1084,7 +1384,6 @@ class File:
 
             err = f.add_table("Sheet1", excelize.Table(range="A1:D5"))
         """
-        lib.AddTable.restype = c_char_p
         options = py_value_to_c(table, types_go._Table())
         err = lib.AddTable(
             self.file_index, sheet.encode(ENCODE), byref(options)
@@ -1097,18 +1396,15 @@ class File:
         extension should be XLSM or XLTM.
 
         Args:
-            file (bytes): The contents buffer of the file
+            file (bytes): The contents buffer of the file, any bytes-like
+            object is accepted
 
         Returns:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        lib.AddVBAProject.restype = c_char_p
-        err = lib.AddVBAProject(
-            self.file_index,
-            cast(file, POINTER(c_ubyte)),
-            len(file),
-        ).decode(ENCODE)
+        buf, buf_len = py_bytes_to_c(file)
+        err = lib.AddVBAProject(self.file_index, buf, buf_len).decode(ENCODE)
         return None if err == "" else Exception(err)
 
     def auto_filter(
@@ -1139,7 +1435,6 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        lib.AutoFilter.restype = c_char_p
         options = (types_go._AutoFilterOptions * len(opts))()
         for i, opt in enumerate(opts):
             options[i] = py_value_to_c(opt, types_go._AutoFilterOptions())
@@ -1171,7 +1466,6 @@ class File:
             result as a string and an exception if an error occurred, otherwise
             None.
         """
-        lib.CalcCellValue.restype = types_go._StringErrorResult
         options = (
             byref(py_value_to_c(opts[0], types_go._Options()))
             if opts
@@ -1191,7 +1485,8 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        err, lib.Close.restype = None, c_char_p
+        self._closed = True
+        self._style_ids.clear()
         err = lib.Close(self.file_index).decode(ENCODE)
         return None if err == "" else Exception(err)
 
@@ -1209,7 +1504,6 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        err, lib.CopySheet.restype = None, c_char_p
         err = lib.CopySheet(self.file_index, src, to).decode(ENCODE)
         return None if err == "" else Exception(err)
 
@@ -1225,7 +1519,6 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        err, lib.DeleteChart.restype = None, c_char_p
         err = lib.DeleteChart(
             self.file_index, sheet.encode(ENCODE), cell.encode(ENCODE)
         ).decode(ENCODE)
@@ -1243,7 +1536,6 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        err, lib.DeleteComment.restype = None, c_char_p
         err = lib.DeleteComment(
             self.file_index, sheet.encode(ENCODE), cell.encode(ENCODE)
         ).decode(ENCODE)
@@ -1271,7 +1563,6 @@ class File:
                 scope="Sheet2",
             ))
         """
-        lib.DeleteDefinedName.restype = c_char_p
         options = py_value_to_c(defined_name, types_go._DefinedName())
         err = lib.DeleteDefinedName(self.file_index, byref(options)).decode(ENCODE)
         return None if err == "" else Exception(err)
@@ -1288,7 +1579,6 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        err, lib.DeletePicture.restype = None, c_char_p
         err = lib.DeletePicture(
             self.file_index, sheet.encode(ENCODE), cell.encode(ENCODE)
         ).decode(ENCODE)
@@ -1309,7 +1599,9 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        err, lib.DeleteSheet.restype = None, c_char_p
+        err = "" if self._closed else _check_sheet_name(sheet)
+        if err != "":
+            return Exception(err)
         err = lib.DeleteSheet(self.file_index, sheet.encode(ENCODE)).decode(ENCODE)
         return None if err == "" else Exception(err)
 
@@ -1324,7 +1616,6 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        err, lib.DeleteSlicer.restype = None, c_char_p
         err = lib.DeleteSlicer(self.file_index, name.encode(ENCODE)).decode(ENCODE)
         return None if err == "" else Exception(err)
 
@@ -1344,7 +1635,6 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        err, lib.DuplicateRow.restype = None, c_char_p
         err = lib.DuplicateRow(self.file_index, sheet.encode(ENCODE), row).decode(
             ENCODE
         )
@@ -1368,7 +1658,6 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        err, lib.DuplicateRowTo.restype = None, c_char_p
         err = lib.DuplicateRowTo(
             self.file_index, sheet.encode(ENCODE), row, row2
         ).decode(ENCODE)
@@ -1382,7 +1671,6 @@ class File:
         Returns:
             int: The active sheet index
         """
-        lib.GetActiveSheetIndex.restype = c_int
         res = lib.GetActiveSheetIndex(self.file_index)
         return res
 
@@ -1397,7 +1685,6 @@ class File:
             containing the app properties if found, otherwise None, and an
             Exception object if an error occurred, otherwise None.
         """
-        lib.GetAppProps.restype = types_go._GetAppPropsResult
         res = lib.GetAppProps(self.file_index)
         err = res.err.decode(ENCODE)
         return (c_value_to_py(res.opts, AppProperties()) if err == "" else None), (
@@ -1419,7 +1706,6 @@ class File:
             Tuple[str, Optional[Exception]]: A tuple containing the cell formula
             string and an exception if an error occurred, otherwise None.
         """
-        lib.GetCellFormula.restype = types_go._StringErrorResult
         res = lib.GetCellFormula(
             self.file_index, sheet.encode(ENCODE), cell.encode(ENCODE)
         )
@@ -1451,7 +1737,6 @@ class File:
 
             link, target, err = f.get_cell_hyperlink("Sheet1", "H6")
         """
-        lib.GetCellHyperLink.restype = types_go._GetCellHyperLinkResult
         res = lib.GetCellHyperLink(
             self.file_index, sheet.encode(ENCODE), cell.encode(ENCODE)
         )
@@ -1474,7 +1759,6 @@ class File:
             Tuple[int, Optional[Exception]]: A tuple containing the cell style,
             and an Exception object if an error occurred, otherwise None.
         """
-        lib.GetCellStyle.restype = types_go._IntErrorResult
         res = lib.GetCellStyle(
             self.file_index, sheet.encode(ENCODE), cell.encode(ENCODE)
         )
@@ -1496,7 +1780,6 @@ class File:
             the rich text runs and an exception if an error occurred, otherwise
             None.
         """
-        lib.GetCellRichText.restype = types_go._GetCellRichTextResult
         res = lib.GetCellRichText(
             self.file_index, sheet.encode(ENCODE), cell.encode(ENCODE)
         )
@@ -1524,7 +1807,6 @@ class File:
             Tuple[str, Optional[Exception]]: A tuple containing the cell value
             as a string and an exception if an error occurred, otherwise None.
         """
-        lib.GetCellValue.restype = types_go._StringErrorResult
         options = (
             byref(py_value_to_c(opts[0], types_go._Options()))
             if opts
@@ -1548,7 +1830,6 @@ class File:
             Tuple[int, Optional[Exception]]: A tuple containing the column style
             ID and an exception if an error occurred, otherwise None.
         """
-        lib.GetColStyle.restype = types_go._IntErrorResult
         res = lib.GetColStyle(self.file_index, sheet.encode(ENCODE), col.encode(ENCODE))
         err = res.err.decode(ENCODE)
         return res.val, None if err == "" else Exception(err)
@@ -1572,7 +1853,6 @@ class File:
 
             visible, err = f.get_col_visible("Sheet1", "D")
         """
-        lib.GetColVisible.restype = types_go._BoolErrorResult
         res = lib.GetColVisible(
             self.file_index, sheet.encode(ENCODE), col.encode(ENCODE)
         )
@@ -1588,7 +1868,6 @@ class File:
             Tuple[str, Optional[Exception]]: A tuple containing the font name as
             a string and an exception if an error occurred, otherwise None.
         """
-        lib.GetDefaultFont.restype = types_go._StringErrorResult
         res = lib.GetDefaultFont(self.file_index)
         err = res.err.decode(ENCODE)
         return res.val.decode(ENCODE), None if err == "" else Exception(err)
@@ -1612,7 +1891,6 @@ class File:
 
             visible, err = f.get_row_visible("Sheet1", 2)
         """
-        lib.GetRowVisible.restype = types_go._BoolErrorResult
         res = lib.GetRowVisible(self.file_index, sheet.encode(ENCODE), c_int(row))
         err = res.err.decode(ENCODE)
         return res.val, None if err == "" else Exception(err)
@@ -1638,7 +1916,6 @@ class File:
             cell value as a string and an exception if an error occurred,
             otherwise None.
         """
-        lib.GetRows.restype = types_go._GetRowsResult
         rows = []
         options = (
             byref(py_value_to_c(opts[0], types_go._Options()))
@@ -1668,7 +1945,6 @@ class File:
             dimension, and an Exception object if an error occurred, otherwise
             None.
         """
-        lib.GetSheetDimension.restype = types_go._StringErrorResult
         res = lib.GetSheetDimension(self.file_index, sheet.encode(ENCODE))
         err = res.err.decode(ENCODE)
         return res.val.decode(ENCODE), None if err == "" else Exception(err)
@@ -1686,7 +1962,6 @@ class File:
             Tuple[int, Optional[Exception]]: A tuple containing the sheet index,
             and an Exception object if an error occurred, otherwise None.
         """
-        lib.GetSheetIndex.restype = types_go._IntErrorResult
         res = lib.GetSheetIndex(self.file_index, sheet.encode(ENCODE))
         err = res.err.decode(ENCODE)
         return res.val, None if err == "" else Exception(err)
@@ -1703,7 +1978,6 @@ class File:
             Style object if found, otherwise None, and an Exception object if an
             error occurred, otherwise None.
         """
-        lib.GetStyle.restype = types_go._GetStyleResult
         res = lib.GetStyle(self.file_index, c_int(style_id))
         err = res.err.decode(ENCODE)
         if err == "":
@@ -1721,7 +1995,6 @@ class File:
             Tuple[List[Table], Optional[Exception]]: A tuple containing the
             tables and an exception if an error occurred, otherwise None.
         """
-        lib.GetTables.restype = types_go._GetTablesResult
         res = lib.GetTables(self.file_index, sheet.encode(ENCODE))
         tables = c_value_to_py(res, GetTablesResult()).tables
         err = res.Err.decode(ENCODE)
@@ -1736,7 +2009,6 @@ class File:
             containing the workbook property options and an exception if an
             error occurred, otherwise None.
         """
-        lib.GetWorkbookProps.restype = types_go._GetWorkbookPropsResult
         res = lib.GetWorkbookProps(self.file_index)
         err = res.err.decode(ENCODE)
         return c_value_to_py(res.opts, WorkbookPropsOptions()) if err == "" else None, (
@@ -1767,7 +2039,6 @@ class File:
 
             err = f.insert_cols("Sheet1", "C", 2)
         """
-        lib.InsertCols.restype = c_char_p
         err = lib.InsertCols(
             self.file_index,
             sheet.encode(ENCODE),
@@ -1800,7 +2071,6 @@ class File:
 
             err = f.insert_rows("Sheet1", 3, 2)
         """
-        lib.InsertRows.restype = c_char_p
         err = lib.InsertRows(
             self.file_index,
             sheet.encode(ENCODE),
@@ -1825,7 +2095,6 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        lib.MergeCell.restype = c_char_p
         err = lib.MergeCell(
             self.file_index,
             sheet.encode(ENCODE),
@@ -1857,7 +2126,6 @@ class File:
 
             err = f.move_sheet("Sheet2", "Sheet1")
         """
-        lib.MoveSheet.restype = c_char_p
         err = lib.MoveSheet(
             self.file_index,
             source.encode(ENCODE),
@@ -1877,7 +2145,6 @@ class File:
             Tuple[int, Optional[Exception]]: A tuple containing the style index
             and an exception if any error occurs.
         """
-        lib.NewConditionalStyle.restype = types_go._IntErrorResult
         options = py_value_to_c(style, types_go._Style())
         res = lib.NewConditionalStyle(self.file_index, byref(options))
         err = res.err.decode(ENCODE)
@@ -1896,7 +2163,9 @@ class File:
             Tuple[int, Optional[Exception]]: A tuple containing the index of the
             new sheet and an Exception if an error occurred, otherwise None.
         """
-        lib.NewSheet.restype = types_go._IntErrorResult
+        err = "" if self._closed else _check_sheet_name(sheet)
+        if err != "":
+            return -1, Exception(err)
         res = lib.NewSheet(self.file_index, sheet.encode(ENCODE))
         err = res.err.decode(ENCODE)
         return res.val, None if err == "" else Exception(err)
@@ -1953,7 +2222,6 @@ class File:
             if err:
                 print(err)
         """
-        lib.NewStreamWriter.restype = types_go._IntErrorResult
         res = lib.NewStreamWriter(self.file_index, sheet.encode(ENCODE))
         err = res.err.decode(ENCODE)
         if err == "":
@@ -1965,7 +2233,9 @@ class File:
         Create the style for cells by a given style options, and returns style
         index. The same style index can not be used across different workbook.
         This function is concurrency safe. Note that the 'Font.Color' field uses
-        an RGB color represented in 'RRGGBB' hexadecimal notation.
+        an RGB color represented in 'RRGGBB' hexadecimal notation. The index of
+        each created style is cached in the workbook, and creating an equal
+        style again returns the cached index without calling the library.
 
         Args:
             style (Style): The style options
@@ -1974,10 +2244,15 @@ class File:
             Tuple[int, Optional[Exception]]: A tuple containing the style index
             and an exception if any error occurs.
         """
-        lib.NewStyle.restype = types_go._IntErrorResult
+        key = _freeze(style)
+        style_id = self._style_ids.get(key)
+        if style_id is not None:
+            return style_id, None
         options = py_value_to_c(style, types_go._Style())
         res = lib.NewStyle(self.file_index, byref(options))
         err = res.err.decode(ENCODE)
+        if err == "":
+            self._style_ids[key] = res.val
         return res.val, None if err == "" else Exception(err)
 
     def protect_sheet(
@@ -2011,7 +2286,6 @@ class File:
                 edit_scenarios=True,
             ))
         """
-        lib.ProtectSheet.restype = c_char_p
         options = py_value_to_c(opts, types_go._SheetProtectionOptions())
         err = lib.ProtectSheet(
             self.file_index, sheet.encode(ENCODE), byref(options)
@@ -2044,7 +2318,6 @@ class File:
                 lock_structure=True,
             ))
         """
-        lib.ProtectWorkbook.restype = c_char_p
         options = py_value_to_c(opts, types_go._WorkbookProtectionOptions())
         err = lib.ProtectWorkbook(self.file_index, byref(options)).decode(ENCODE)
         return None if err == "" else Exception(err)
@@ -2072,7 +2345,6 @@ class File:
 
             err = f.remove_col("Sheet1", "C")
         """
-        lib.RemoveCol.restype = c_char_p
         err = lib.RemoveCol(
             self.file_index, sheet.encode(ENCODE), col.encode(ENCODE)
         ).decode(ENCODE)
@@ -2090,7 +2362,6 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        lib.RemovePageBreak.restype = c_char_p
         err = lib.RemovePageBreak(
             self.file_index, sheet.encode(ENCODE), cell.encode(ENCODE)
         ).decode(ENCODE)
@@ -2119,12 +2390,50 @@ class File:
 
             err = f.remove_row("Sheet1", 3)
         """
-        lib.RemoveRow.restype = c_char_p
         err = lib.RemoveRow(self.file_index, sheet.encode(ENCODE), c_int(row)).decode(
             ENCODE
         )
         return None if err == "" else Exception(err)
 
+    def rows(self, sheet: str) -> Tuple[Optional[Rows], Optional[Exception]]:
+        """
+        Returns a rows iterator, used for streaming reading data for a
+        worksheet with a large data. Unlike 'get_rows', only the cell values of
+        the current row are passed to Python at a time. This function is
+        concurrency safe.
+
+        Args:
+            sheet (str): The worksheet name
+
+        Returns:
+            Tuple[Optional[Rows], Optional[Exception]]: A tuple containing rows
+            iterator object if successful, or None and an Exception if an error
+            occurred.
+
+        Example:
+            For example, get and traverse the value of all cells by rows on a
+            worksheet named 'Sheet1':
+
+            .. code-block:: python
+
+            rows, err = f.rows("Sheet1")
+            if err:
+                print(err)
+            while rows.next():
+                row, err = rows.columns()
+                if err:
+                    print(err)
+                print(row)
+            err = rows.close()
+            if err:
+                print(err)
+        """
+        res = lib.Rows(self.file_index, sheet.encode(ENCODE))
+        err = res.err.decode(ENCODE)
+        if err == "":
+            return Rows(res.val), None
+        return None, Exception(err)
+
     def search_sheet(
         self, sheet: str, value: str, *reg: bool
     ) -> Tuple[List[str], Optional[Exception]]:
@@ -2159,7 +2468,6 @@ class File:
             result, err = f.search_sheet("Sheet1", "[0-9]", True)
             ```
         """
-        lib.SearchSheet.restype = types_go._StringArrayErrorResult
         res = lib.SearchSheet(
             self.file_index,
             sheet.encode(ENCODE),
@@ -2184,7 +2492,6 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        err, lib.SetActiveSheet.restype = None, c_char_p
         err = lib.SetActiveSheet(self.file_index, index).decode(ENCODE)
         return None if err == "" else Exception(err)
 
@@ -2202,7 +2509,6 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        err, lib.SetCellBool.restype = None, c_char_p
         err = lib.SetCellBool(
             self.file_index, sheet.encode(ENCODE), cell.encode(ENCODE), value
         ).decode(ENCODE)
@@ -2230,7 +2536,6 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        err, lib.SetCellFormula.restype = None, c_char_p
         options = (
             byref(py_value_to_c(opts[0], types_go._FormulaOpts()))
             if opts
@@ -2299,7 +2604,6 @@ class File:
                 print(err)
             err = f.set_cell_style("Sheet1", "A3", "A3", style)
         """
-        err, lib.SetCellHyperLink.restype = None, c_char_p
         options = (
             byref(py_value_to_c(opts[0], types_go._HyperlinkOpts()))
             if opts
@@ -2334,7 +2638,6 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        lib.SetCellInt.restype = c_char_p
         err = lib.SetCellInt(
             self.file_index,
             sheet.encode(ENCODE),
@@ -2475,7 +2778,6 @@ class File:
             if err:
                 print(err)
         """
-        lib.SetCellRichText.restype = c_char_p
         vals = (types_go._RichTextRun * len(runs))()
         for i, value in enumerate(runs):
             vals[i] = py_value_to_c(value, types_go._RichTextRun())
@@ -2507,7 +2809,6 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        lib.SetCellStr.restype = c_char_p
         err = lib.SetCellStr(
             self.file_index,
             sheet.encode(ENCODE),
@@ -2540,7 +2841,6 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        lib.SetCellStyle.restype = c_char_p
         err = lib.SetCellStyle(
             self.file_index,
             sheet.encode(ENCODE),
@@ -2577,7 +2877,6 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        lib.SetCellValue.restype = c_char_p
         err = lib.SetCellValue(
             self.file_index,
             sheet.encode(ENCODE),
@@ -2586,6 +2885,55 @@ class File:
         ).decode(ENCODE)
         return None if err == "" else Exception(err)
 
+    def set_cell_values(
+        self,
+        sheet: str,
+        cell: str,
+        values: List[List[Union[None, int, str, bool, datetime, date]]],
+    ) -> Optional[Exception]:
+        """
+        Set the values of a range of cells by given worksheet name, top-left
+        cell reference and a two-dimensional list of values, each item of the
+        list will be written to a row starting at the column of the given cell.
+        All values are written with a single library call, prefer this function
+        over calling 'set_cell_value' for each cell when writing a block of
+        cells.
+
+        Args:
+            sheet (str): The worksheet name
+            cell (str): The top-left cell reference
+            values (List[List[Union[None, int, str, bool, datetime, date]]]):
+            The cell values of each row
+
+        Returns:
+            Optional[Exception]: Returns None if no error occurred,
+            otherwise returns an Exception with the message.
+
+        Example:
+            For example, write a block of 2 rows x 3 columns start at cell B2 in
+            Sheet1:
+
+            .. code-block:: python
+
+            err = f.set_cell_values("Sheet1", "B2", [[1, 2, 3], ["A", "B", "C"]])
+        """
+        lengths = (c_int * len(values))(*[len(row) for row in values])
+        vals = (types_go._Interface * sum(lengths))()
+        i = 0
+        for row in values:
+            for value in row:
+                vals[i] = py_value_to_c_interface(value)
+                i += 1
+        err = lib.SetCellValues(
+            self.file_index,
+            sheet.encode(ENCODE),
+            cell.encode(ENCODE),
+            byref(vals),
+            byref(lengths),
+            len(lengths),
+        ).decode(ENCODE)
+        return None if err == "" else Exception(err)
+
     def set_col_outline_level(
         self, sheet: str, col: str, level: int
     ) -> Optional[Exception]:
@@ -2609,7 +2957,6 @@ class File:
 
             err = f.set_col_outline_level("Sheet1", "D", 2)
         """
-        lib.SetColOutlineLevel.restype = c_char_p
         err = lib.SetColOutlineLevel(
             self.file_index, sheet.encode(ENCODE), col.encode(ENCODE), level
         ).decode(ENCODE)
@@ -2640,7 +2987,6 @@ class File:
 
             err = f.set_col_style("Sheet1", "H", style)
         """
-        lib.SetColStyle.restype = c_char_p
         err = lib.SetColStyle(
             self.file_index, sheet.encode(ENCODE), columns.encode(ENCODE), style_id
         ).decode(ENCODE)
@@ -2669,7 +3015,6 @@ class File:
 
             err = f.set_col_visible("Sheet1", "D", False)
         """
-        lib.SetColVisible.restype = c_char_p
         err = lib.SetColVisible(
             self.file_index, sheet.encode(ENCODE), columns.encode(ENCODE), visible
         ).decode(ENCODE)
@@ -2698,7 +3043,6 @@ class File:
 
             err = f.set_col_width("Sheet1", "A", "H", 20)
         """
-        lib.SetColWidth.restype = c_char_p
         err = lib.SetColWidth(
             self.file_index,
             sheet.encode(ENCODE),
@@ -2728,7 +3072,6 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        lib.SetConditionalFormat.restype = c_char_p
         vals = (types_go._ConditionalFormatOptions * len(opts))()
         for i, value in enumerate(opts):
             vals[i] = py_value_to_c(value, types_go._ConditionalFormatOptions())
@@ -2753,7 +3096,6 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        lib.SetDefaultFont.restype = c_char_p
         err = lib.SetDefaultFont(self.file_index, font_name.encode(ENCODE)).decode(
             ENCODE
         )
@@ -2783,7 +3125,6 @@ class File:
                 scope="Sheet2",
             ))
         """
-        lib.SetDefinedName.restype = c_char_p
         options = py_value_to_c(defined_name, types_go._DefinedName())
         err = lib.SetDefinedName(self.file_index, byref(options)).decode(ENCODE)
         return None if err == "" else Exception(err)
@@ -2823,7 +3164,6 @@ class File:
                 )
             )
         """
-        lib.SetDocProps.restype = c_char_p
         options = py_value_to_c(doc_properties, types_go._DocProperties())
         err = lib.SetDocProps(self.file_index, byref(options)).decode(ENCODE)
         return None if err == "" else Exception(err)
@@ -2861,7 +3201,6 @@ class File:
                 ),
             )
         """
-        lib.SetHeaderFooter.restype = c_char_p
         options = py_value_to_c(opts, types_go._HeaderFooterOptions())
         err = lib.SetHeaderFooter(
             self.file_index, sheet.encode(ENCODE), byref(options)
@@ -2882,7 +3221,6 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        lib.SetPageLayout.restype = c_char_p
         options = py_value_to_c(opts, types_go._PageLayoutOptions())
         err = lib.SetPageLayout(
             self.file_index, sheet.encode(ENCODE), byref(options)
@@ -2903,7 +3241,6 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        lib.SetPageMargins.restype = c_char_p
         options = py_value_to_c(opts, types_go._PageLayoutMarginsOptions())
         err = lib.SetPageMargins(
             self.file_index, sheet.encode(ENCODE), byref(options)
@@ -2923,7 +3260,6 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        lib.SetPanes.restype = c_char_p
         options = py_value_to_c(opts, types_go._Panes())
         err = lib.SetPanes(
             self.file_index, sheet.encode(ENCODE), byref(options)
@@ -2954,7 +3290,6 @@ class File:
 
             err = f.set_row_height("Sheet1", 1, 50)
         """
-        lib.SetRowHeight.restype = c_char_p
         err = lib.SetRowHeight(
             self.file_index, sheet.encode(ENCODE), c_int(row), c_double(height)
         ).decode(ENCODE)
@@ -2981,7 +3316,6 @@ class File:
 
             err = f.set_row_outline("Sheet1", 2, 1)
         """
-        lib.SetRowOutlineLevel.restype = c_char_p
         err = lib.SetRowOutlineLevel(
             self.file_index, sheet.encode(ENCODE), c_int(row), c_int(level)
         ).decode(ENCODE)
@@ -3012,7 +3346,6 @@ class File:
 
             err = f.set_row_style("Sheet1", 1, 1, style_id)
         """
-        lib.SetRowStyle.restype = c_char_p
         err = lib.SetRowStyle(
             self.file_index,
             sheet.encode(ENCODE),
@@ -3045,7 +3378,6 @@ class File:
 
             err = f.set_row_visible("Sheet1", 2, False)
         """
-        lib.SetRowVisible.restype = c_char_p
         err = lib.SetRowVisible(
             self.file_index,
             sheet.encode(ENCODE),
@@ -3068,7 +3400,6 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        lib.SetSheetBackground.restype = c_char_p
         err = lib.SetSheetBackground(
             self.file_index,
             sheet.encode(ENCODE),
@@ -3087,19 +3418,20 @@ class File:
         Args:
             sheet (str): The worksheet name
             extension (str): The image extension
-            picture (bytes): The contents buffer of the file
+            picture (bytes): The contents buffer of the file, any bytes-like
+            object is accepted
 
         Returns:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        lib.SetSheetBackgroundFromBytes.restype = c_char_p
+        buf, buf_len = py_bytes_to_c(picture)
         err = lib.SetSheetBackgroundFromBytes(
             self.file_index,
             sheet.encode(ENCODE),
             extension.encode(ENCODE),
-            cast(picture, POINTER(c_ubyte)),
-            len(picture),
+            buf,
+            buf_len,
         ).decode(ENCODE)
         return None if err == "" else Exception(err)
 
@@ -3123,7 +3455,6 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        lib.SetSheetCol.restype = c_char_p
         vals = (types_go._Interface * len(values))()
         for i, value in enumerate(values):
             vals[i] = py_value_to_c_interface(value)
@@ -3152,7 +3483,6 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        lib.SetSheetDimension.restype = c_char_p
         err = lib.SetSheetDimension(
             self.file_index,
             sheet.encode(ENCODE),
@@ -3176,7 +3506,6 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        lib.SetSheetName.restype = c_char_p
         err = lib.SetSheetName(
             self.file_index,
             source.encode(ENCODE),
@@ -3198,7 +3527,6 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        lib.SetSheetProps.restype = c_char_p
         options = py_value_to_c(opts, types_go._SheetPropsOptions())
         err = lib.SetSheetProps(
             self.file_index, sheet.encode(ENCODE), byref(options)
@@ -3225,7 +3553,6 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        lib.SetSheetRow.restype = c_char_p
         vals = (types_go._Interface * len(values))()
         for i, value in enumerate(values):
             vals[i] = py_value_to_c_interface(value)
@@ -3254,7 +3581,6 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        lib.SetSheetView.restype = c_char_p
         options = py_value_to_c(opts, types_go._ViewOptions())
         err = lib.SetSheetView(
             self.file_index, sheet.encode(ENCODE), view_index, byref(options)
@@ -3279,7 +3605,6 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        lib.SetSheetVisible.restype = c_char_p
         vh = False
         if len(very_hidden) > 0:
             vh = very_hidden[0]
@@ -3299,7 +3624,6 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        lib.SetWorkbookProps.restype = c_char_p
         options = py_value_to_c(opts, types_go._WorkbookPropsOptions())
         err = lib.SetWorkbookProps(self.file_index, byref(options)).decode(ENCODE)
         return None if err == "" else Exception(err)
@@ -3312,7 +3636,6 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        lib.UngroupSheets.restype = c_char_p
         err = lib.UngroupSheets(self.file_index).decode(ENCODE)
         return None if err == "" else Exception(err)
 
@@ -3338,7 +3661,6 @@ class File:
 
             err = f.unmerge_cell("Sheet1", "D3", "E9")
         """
-        lib.UnmergeCell.restype = c_char_p
         err = lib.UnmergeCell(
             self.file_index,
             sheet.encode(ENCODE),
@@ -3361,14 +3683,67 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        lib.UpdateLinkedValue.restype = c_char_p
         err = lib.UpdateLinkedValue(self.file_index).decode(ENCODE)
         return None if err == "" else Exception(err)
 
+    def write_to_buffer(self, *opts: Options) -> Tuple[bytes, Optional[Exception]]:
+        """
+        Get the contents of the spreadsheet as bytes without saving it to disk.
+
+        Args:
+            *opts (Options): Optional parameters for writing the file.
+
+        Returns:
+            Tuple[bytes, Optional[Exception]]: A tuple containing the contents
+            of the spreadsheet and an exception if any error occurs.
+
+        Example:
+            For example, get the workbook contents and open it again from the
+            buffer:
+
+            .. code-block:: python
+
+            buf, err = f.write_to_buffer()
+            if err:
+                print(err)
+            f2, err = excelize.open_reader(buf)
+        """
+        options = (
+            byref(py_value_to_c(opts[0], types_go._Options()))
+            if opts
+            else POINTER(types_go._Options)()
+        )
+        res = lib.WriteToBuffer(self.file_index, options)
+        err = res.Err.decode(ENCODE)
+        if err != "":
+            return b"", Exception(err)
+        buf = string_at(res.Arr, res.ArrLen)
+        lib.FreeBuffer(res.Arr)
+        return buf, None
+
+
+@lru_cache(maxsize=1 << 16)
+def _cell_name_to_coordinates(cell: str) -> Tuple[int, int, str]:
+    """
+    Converts alphanumeric cell name to [X, Y] coordinates by the library, the
+    results are cached by the given cell reference.
+
+    Args:
+        cell (str): The cell reference
+
+    Returns:
+        Tuple[int, int, str]: A tuple containing the column number, row number,
+        and the error message, which is empty if no error occurred.
+    """
+    res = lib.CellNameToCoordinates(cell.encode(ENCODE))
+    return res.col, res.row, res.err.decode(ENCODE)
+
 
 def cell_name_to_coordinates(cell: str) -> Tuple[int, int, Optional[Exception]]:
     """
     Converts alphanumeric cell name to [X, Y] coordinates or returns an error.
+    The results are cached, repeated conversions of the same cell reference
+    will not call into the library.
 
     Args:
         cell (str): The cell reference
@@ -3377,16 +3752,33 @@ def cell_name_to_coordinates(cell: str) -> Tuple[int, int, Optional[Exception]]:
         Tuple[int, int, Optional[Exception]]: A tuple containing the column
         number, row number, and an Exception if an error occurred, otherwise None.
     """
-    lib.CellNameToCoordinates.restype = types_go._CellNameToCoordinatesResult
-    res = lib.CellNameToCoordinates(cell.encode(ENCODE))
-    err = res.err.decode(ENCODE)
-    return res.col, res.row, None if err == "" else Exception(err)
+    col, row, err = _cell_name_to_coordinates(cell)
+    return col, row, None if err == "" else Exception(err)
+
+
+@lru_cache(maxsize=1 << 16)
+def _column_name_to_number(name: str) -> Tuple[int, str]:
+    """
+    Convert Excel sheet column name to int by the library, the results are
+    cached by the given column name.
+
+    Args:
+        name (str): The column name
+
+    Returns:
+        Tuple[int, str]: A tuple containing the column number and the error
+        message, which is empty if no error occurred.
+    """
+    res = lib.ColumnNameToNumber(name.encode(ENCODE))
+    return res.val, res.err.decode(ENCODE)
 
 
 def column_name_to_number(name: str) -> Tuple[int, Optional[Exception]]:
     """
     Convert Excel sheet column name (case-insensitive) to int. The function
-    returns an error if column name incorrect.
+    returns an error if column name incorrect. The results are cached,
+    repeated conversions of the same column name will not call into the
+    library.
 
     Args:
         name (str): The column name
@@ -3395,15 +3787,32 @@ def column_name_to_number(name: str) -> Tuple[int, Optional[Exception]]:
         Tuple[int, Optional[Exception]]: A tuple containing the column number
         and an Exception if an error occurred, otherwise None.
     """
-    lib.ColumnNameToNumber.restype = types_go._IntErrorResult
-    res = lib.ColumnNameToNumber(name.encode(ENCODE))
-    err = res.err.decode(ENCODE)
-    return res.val, None if err == "" else Exception(err)
+    col, err = _column_name_to_number(name)
+    return col, None if err == "" else Exception(err)
+
+
+@lru_cache(maxsize=1 << 16)
+def _column_number_to_name(num: int) -> Tuple[str, str]:
+    """
+    Convert the column number to Excel sheet column name by the library, the
+    results are cached by the given column number.
+
+    Args:
+        num (int): The column number
+
+    Returns:
+        Tuple[str, str]: A tuple containing the column name and the error
+        message, which is empty if no error occurred.
+    """
+    res = lib.ColumnNumberToName(c_int(num))
+    return res.val.decode(ENCODE), res.err.decode(ENCODE)
 
 
 def column_number_to_name(num: int) -> Tuple[str, Optional[Exception]]:
     """
-    Convert the integer to Excel sheet column title.
+    Convert the integer to Excel sheet column title. The results are cached,
+    repeated conversions of the same column number will not call into the
+    library.
 
     Args:
         num (int): The column number
@@ -3412,10 +3821,27 @@ def column_number_to_name(num: int) -> Tuple[str, Optional[Exception]]:
         Tuple[str, Optional[Exception]]: A tuple containing the column name and
         an Exception if an error occurred, otherwise None.
     """
-    lib.ColumnNumberToName.restype = types_go._StringErrorResult
-    res = lib.ColumnNumberToName(c_int(num))
-    err = res.err.decode(ENCODE)
-    return res.val.decode(ENCODE), None if err == "" else Exception(err)
+    name, err = _column_number_to_name(num)
+    return name, None if err == "" else Exception(err)
+
+
+@lru_cache(maxsize=1 << 16)
+def _coordinates_to_cell_name(col: int, row: int, abs: bool) -> Tuple[str, str]:
+    """
+    Converts [X, Y] coordinates to alpha-numeric cell name by the library, the
+    results are cached by the given coordinates.
+
+    Args:
+        col (int): The column number
+        row (int): The row number
+        abs (bool): Specifies the absolute cell references
+
+    Returns:
+        Tuple[str, str]: A tuple containing the cell name and the error
+        message, which is empty if no error occurred.
+    """
+    res = lib.CoordinatesToCellName(col, row, abs)
+    return res.val.decode(ENCODE), res.err.decode(ENCODE)
 
 
 def coordinates_to_cell_name(
@@ -3423,6 +3849,8 @@ def coordinates_to_cell_name(
 ) -> Tuple[str, Optional[Exception]]:
     """
     Converts [X, Y] coordinates to alpha-numeric cell name or returns an error.
+    The results are cached, repeated conversions of the same coordinates will
+    not call into the library.
 
     Args:
         col (int): The column number.
@@ -3435,13 +3863,11 @@ def coordinates_to_cell_name(
         Tuple[str, Optional[Exception]]: A tuple containing the cell name as a
         string and an Exception if an error occurred, otherwise None.
     """
-    lib.CoordinatesToCellName.restype = types_go._StringErrorResult
     options = False
     if len(abs) > 0:
         options = abs[0]
-    res = lib.CoordinatesToCellName(col, row, options)
-    err = res.err.decode(ENCODE)
-    return res.val.decode(ENCODE), None if err == "" else Exception(err)
+    cell, err = _coordinates_to_cell_name(col, row, options)
+    return cell, None if err == "" else Exception(err)
 
 
 def new_file() -> File:
@@ -3469,7 +3895,7 @@ def open_file(
         Tuple[Optional[File], Optional[Exception]]: A tuple containing a File
         object if successful, or None and an Exception if an error occurred.
     """
-    lib.OpenFile.restype, options = types_go._IntErrorResult, None
+    options = None
     if len(opts) > 0:
         options = byref(py_value_to_c(opts[0], types_go._Options()))
     res = lib.OpenFile(filename.encode(ENCODE), options)
@@ -3486,17 +3912,19 @@ def open_reader(
     Read data stream from bytes and return a populated spreadsheet file.
 
     Args:
-        buffer (bytes): The contents buffer of the file
+        buffer (bytes): The contents buffer of the file, any bytes-like object
+        is accepted
         *opts (Options): Optional parameters for opening the file.
 
     Returns:
         Tuple[Optional[File], Optional[Exception]]: A tuple containing a File
         object if successful, or None and an Exception if an error occurred.
     """
-    lib.OpenReader.restype, options = types_go._IntErrorResult, None
+    options = None
     if len(opts) > 0:
         options = byref(py_value_to_c(opts[0], types_go._Options()))
-    res = lib.OpenReader(cast(buffer, POINTER(c_ubyte)), len(buffer), options)
+    buf, buf_len = py_bytes_to_c(buffer)
+    res = lib.OpenReader(buf, buf_len, options)
     err = res.err.decode(ENCODE)
     if err == "":
         return File(res.val), None
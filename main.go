@@ -22,6 +22,7 @@ import (
 	"errors"
 	"reflect"
 	"sync"
+	"sync/atomic"
 	"time"
 	"unicode"
 	"unsafe"
@@ -45,12 +46,19 @@ const (
 )
 
 var (
-	files, sw          = sync.Map{}, sync.Map{}
+	files, sw, rowIter = sync.Map{}, sync.Map{}, sync.Map{}
 	emptyString        string
 	errFilePtr         = "can not find file pointer"
 	errStreamWriterPtr = "can not find stream writer pointer"
+	errRowsPtr         = "can not find rows iterator pointer"
 	errArgType         = errors.New("invalid argument data type")
 
+	// fileSeq, swSeq and rowIterSeq generate the handles stored in files, sw
+	// and rowIter. Handles are never reused, so a handle released by Close
+	// can't be handed out again while an older handle is still open, and
+	// concurrent calls always get distinct handles.
+	fileSeq, swSeq, rowIterSeq atomic.Int64
+
 	// goBaseTypes defines Go's basic data types.
 	goBaseTypes = map[reflect.Kind]bool{
 		reflect.Bool:    true,
@@ -255,6 +263,11 @@ func cValueToGo(cVal reflect.Value, goType reflect.Type) (reflect.Value, error)
 				cArrayLen := int(cVal.FieldByName(field.Name + "Len").Int())
 				cArray = cToGoArray(cArray, cArrayLen)
 				for i := 0; i < cArray.Len(); i++ {
+					if cArray.Index(i).IsNil() {
+						// The NULL pointer element
+						s.Field(resultFieldIdx).Set(reflect.Append(s.Field(resultFieldIdx), reflect.Zero(ele)))
+						continue
+					}
 					if goBaseTypes[subEle.Kind()] {
 						// Pointer array of the Go basic data type, for example: []*string
 						v, err := cToGoBaseType(cArray.Index(i), subEle.Kind())
@@ -402,16 +415,12 @@ func goValueToC(goVal, cVal reflect.Value) (reflect.Value, error) {
 					ele := reflect.NewAt(cBaseVal.Type(), elePtr).Elem()
 					ele.Set(cBaseVal)
 				} else {
-					// The Go struct array, for example: []excelize.Options
-					cPtr := C.malloc(C.size_t(cField.Type.Elem().Size()))
-					cStructPtr := reflect.NewAt(cField.Type.Elem(), cPtr)
-					v, err := goValueToC(goSlice.Index(j), cStructPtr)
-					if err != nil {
+					// The Go struct array, for example: []excelize.Options, convert
+					// each element in place in the array
+					elePtr := unsafe.Pointer(uintptr(cArray) + uintptr(j)*cField.Type.Elem().Size())
+					if _, err := goValueToC(goSlice.Index(j), reflect.NewAt(cField.Type.Elem(), elePtr)); err != nil {
 						return result, err
 					}
-					elePtr := unsafe.Pointer(uintptr(cArray) + uintptr(j)*cField.Type.Elem().Size())
-					ele := reflect.NewAt(cField.Type.Elem(), elePtr).Elem()
-					ele.Set(reflect.NewAt(cField.Type.Elem(), unsafe.Pointer(v.Pointer())).Elem())
 				}
 			}
 			c.FieldByName(field.Name).Set(reflect.NewAt(cField.Type.Elem(), cArray))
@@ -992,6 +1001,28 @@ func DuplicateRowTo(idx int, sheet *C.char, row, row2 int) *C.char {
 	return C.CString(emptyString)
 }
 
+// FreeBuffer provides a function to release the buffer returned by
+// WriteToBuffer.
+//
+//export FreeBuffer
+func FreeBuffer(buf *C.uchar) {
+	C.free(unsafe.Pointer(buf))
+}
+
+// FreeStringArrayErrorResult provides a function to release the string array
+// and the error message returned by RowsColumns.
+//
+//export FreeStringArrayErrorResult
+func FreeStringArrayErrorResult(res *C.struct_StringArrayErrorResult) {
+	if res.Arr != nil {
+		for _, v := range unsafe.Slice(res.Arr, int(res.ArrLen)) {
+			C.free(unsafe.Pointer(v))
+		}
+		C.free(unsafe.Pointer(res.Arr))
+	}
+	C.free(unsafe.Pointer(res.Err))
+}
+
 // GetActiveSheetIndex provides a function to get active sheet index of the
 // spreadsheet. If not found the active sheet will be return integer 0.
 //
@@ -1425,12 +1456,7 @@ func NewConditionalStyle(idx int, style *C.struct_Style) C.struct_IntErrorResult
 //
 //export NewFile
 func NewFile() int {
-	f, idx := excelize.NewFile(), 0
-	files.Range(func(_, _ interface{}) bool {
-		idx++
-		return true
-	})
-	idx++
+	f, idx := excelize.NewFile(), int(fileSeq.Add(1))
 	files.Store(idx, f)
 	return idx
 }
@@ -1473,12 +1499,7 @@ func NewStreamWriter(idx int, sheet *C.char) C.struct_IntErrorResult {
 	if err != nil {
 		return C.struct_IntErrorResult{val: C.int(0), err: C.CString(err.Error())}
 	}
-	var swIdx int
-	sw.Range(func(_, _ interface{}) bool {
-		swIdx++
-		return true
-	})
-	swIdx++
+	swIdx := int(swSeq.Add(1))
 	sw.Store(swIdx, streamWriter)
 	return C.struct_IntErrorResult{val: C.int(swIdx), err: C.CString(emptyString)}
 }
@@ -1648,12 +1669,7 @@ func OpenFile(filename *C.char, opts *C.struct_Options) C.struct_IntErrorResult
 	if err != nil {
 		return C.struct_IntErrorResult{val: C.int(-1), err: C.CString(err.Error())}
 	}
-	var idx int
-	files.Range(func(_, _ interface{}) bool {
-		idx++
-		return true
-	})
-	idx++
+	idx := int(fileSeq.Add(1))
 	files.Store(idx, f)
 	return C.struct_IntErrorResult{val: C.int(idx), err: C.CString(emptyString)}
 }
@@ -1671,17 +1687,14 @@ func OpenReader(b *C.uchar, bLen C.int, opts *C.struct_Options) C.struct_IntErro
 		}
 		options = goVal.Elem().Interface().(excelize.Options)
 	}
-	buf := C.GoBytes(unsafe.Pointer(b), bLen)
+	// The reader reads all contents into its own buffer before returning, so
+	// the caller's buffer is read in place instead of being copied first.
+	buf := unsafe.Slice((*byte)(unsafe.Pointer(b)), int(bLen))
 	f, err := excelize.OpenReader(bytes.NewReader(buf), options)
 	if err != nil {
 		return C.struct_IntErrorResult{val: C.int(-1), err: C.CString(err.Error())}
 	}
-	var idx int
-	files.Range(func(_, _ interface{}) bool {
-		idx++
-		return true
-	})
-	idx++
+	idx := int(fileSeq.Add(1))
 	files.Store(idx, f)
 	return C.struct_IntErrorResult{val: C.int(idx), err: C.CString(emptyString)}
 }
@@ -1781,6 +1794,96 @@ func RemoveRow(idx int, sheet *C.char, row int) *C.char {
 	return C.CString(emptyString)
 }
 
+// Rows returns a rows iterator, used for streaming reading data for a
+// worksheet with a large data. This function is concurrency safe.
+//
+//export Rows
+func Rows(idx int, sheet *C.char) C.struct_IntErrorResult {
+	f, ok := files.Load(idx)
+	if !ok {
+		return C.struct_IntErrorResult{val: C.int(0), err: C.CString(errFilePtr)}
+	}
+	rowsIterator, err := f.(*excelize.File).Rows(C.GoString(sheet))
+	if err != nil {
+		return C.struct_IntErrorResult{val: C.int(0), err: C.CString(err.Error())}
+	}
+	rIdx := int(rowIterSeq.Add(1))
+	rowIter.Store(rIdx, rowsIterator)
+	return C.struct_IntErrorResult{val: C.int(rIdx), err: C.CString(emptyString)}
+}
+
+// RowsClose closes the open worksheet XML file in the system temporary
+// directory.
+//
+//export RowsClose
+func RowsClose(rIdx int) *C.char {
+	rowsIterator, ok := rowIter.Load(rIdx)
+	if !ok {
+		return C.CString(errRowsPtr)
+	}
+	defer rowIter.Delete(rIdx)
+	if err := rowsIterator.(*excelize.Rows).Close(); err != nil {
+		return C.CString(err.Error())
+	}
+	return C.CString(emptyString)
+}
+
+// RowsColumns return the current row's column values. This fetches the
+// worksheet data as a stream, returns each cell in a row as is, and will not
+// skip empty rows in the tail of the worksheet. The returned result is
+// allocated by C and must be released by FreeStringArrayErrorResult.
+//
+//export RowsColumns
+func RowsColumns(rIdx int, opts *C.struct_Options) C.struct_StringArrayErrorResult {
+	var options excelize.Options
+	rowsIterator, ok := rowIter.Load(rIdx)
+	if !ok {
+		return C.struct_StringArrayErrorResult{Err: C.CString(errRowsPtr)}
+	}
+	if opts != nil {
+		goVal, err := cValueToGo(reflect.ValueOf(*opts), reflect.TypeOf(excelize.Options{}))
+		if err != nil {
+			return C.struct_StringArrayErrorResult{Err: C.CString(err.Error())}
+		}
+		options = goVal.Elem().Interface().(excelize.Options)
+	}
+	result, err := rowsIterator.(*excelize.Rows).Columns(options)
+	if err != nil {
+		return C.struct_StringArrayErrorResult{Err: C.CString(err.Error())}
+	}
+	cArray := C.malloc(C.size_t(len(result)) * C.size_t(unsafe.Sizeof(uintptr(0))))
+	cArrayPtr := (*[1 << 30]*C.char)(cArray)
+	for i, v := range result {
+		cArrayPtr[i] = C.CString(v)
+	}
+	return C.struct_StringArrayErrorResult{ArrLen: C.int(len(result)), Arr: (**C.char)(cArray), Err: C.CString(emptyString)}
+}
+
+// RowsError will return the error when the error occurs.
+//
+//export RowsError
+func RowsError(rIdx int) *C.char {
+	rowsIterator, ok := rowIter.Load(rIdx)
+	if !ok {
+		return C.CString(errRowsPtr)
+	}
+	if err := rowsIterator.(*excelize.Rows).Error(); err != nil {
+		return C.CString(err.Error())
+	}
+	return C.CString(emptyString)
+}
+
+// RowsNext will return true if find the next row element.
+//
+//export RowsNext
+func RowsNext(rIdx int) bool {
+	rowsIterator, ok := rowIter.Load(rIdx)
+	if !ok {
+		return false
+	}
+	return rowsIterator.(*excelize.Rows).Next()
+}
+
 // Save provides a function to override the spreadsheet with origin path.
 //
 //export Save
@@ -2045,6 +2148,44 @@ func SetCellValue(idx int, sheet, cell *C.char, value *C.struct_Interface) *C.ch
 	return C.CString(emptyString)
 }
 
+// SetCellValues provides a function to set the values of a range of cells by
+// given worksheet name, top-left cell reference and the values of each row.
+// The values of all rows are passed in a single array, and the number of
+// values in each row is given by the 'lengths' array.
+//
+//export SetCellValues
+func SetCellValues(idx int, sheet, cell *C.char, values *C.struct_Interface, lengths *C.int, rows int) *C.char {
+	f, ok := files.Load(idx)
+	if !ok {
+		return C.CString(errFilePtr)
+	}
+	col, row, err := excelize.CellNameToCoordinates(C.GoString(cell))
+	if err != nil {
+		return C.CString(err.Error())
+	}
+	var total, offset int
+	rowLens := unsafe.Slice(lengths, rows)
+	for _, length := range rowLens {
+		total += int(length)
+	}
+	vals := unsafe.Slice(values, total)
+	for i, length := range rowLens {
+		cells := make([]interface{}, int(length))
+		for j, val := range vals[offset : offset+int(length)] {
+			cells[j] = cInterfaceToGo(val)
+		}
+		offset += int(length)
+		ref, err := excelize.CoordinatesToCellName(col, row+i)
+		if err != nil {
+			return C.CString(err.Error())
+		}
+		if err := f.(*excelize.File).SetSheetRow(C.GoString(sheet), ref, &cells); err != nil {
+			return C.CString(err.Error())
+		}
+	}
+	return C.CString(emptyString)
+}
+
 // SetColOutlineLevel provides a function to set outline level of a single
 // column by given worksheet name and column name. The value of parameter
 // 'level' is 1-7.
@@ -2561,5 +2702,30 @@ func UpdateLinkedValue(idx int) *C.char {
 	return C.CString(emptyString)
 }
 
+// WriteToBuffer provides a function to get the contents of the spreadsheet as
+// bytes without saving it to disk. The returned buffer is allocated by C and
+// must be released by FreeBuffer.
+//
+//export WriteToBuffer
+func WriteToBuffer(idx int, opts *C.struct_Options) C.struct_BytesErrorResult {
+	f, ok := files.Load(idx)
+	if !ok {
+		return C.struct_BytesErrorResult{Err: C.CString(errFilePtr)}
+	}
+	var options []excelize.Options
+	if opts != nil {
+		goVal, err := cValueToGo(reflect.ValueOf(*opts), reflect.TypeOf(excelize.Options{}))
+		if err != nil {
+			return C.struct_BytesErrorResult{Err: C.CString(err.Error())}
+		}
+		options = append(options, goVal.Elem().Interface().(excelize.Options))
+	}
+	var buf bytes.Buffer
+	if err := f.(*excelize.File).Write(&buf, options...); err != nil {
+		return C.struct_BytesErrorResult{Err: C.CString(err.Error())}
+	}
+	return C.struct_BytesErrorResult{ArrLen: C.int(buf.Len()), Arr: (*C.uchar)(C.CBytes(buf.Bytes())), Err: C.CString(emptyString)}
+}
+
 func main() {
 }
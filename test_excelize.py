@@ -13,44 +13,90 @@ amounts of data. This library needs Python version 3.9 or later.
 import excelize
 import unittest
 from dataclasses import dataclass
-from unittest.mock import patch
 import datetime
 import random
+from functools import lru_cache
 from typing import List, Optional
 from ctypes import (
     c_int,
     Structure,
     POINTER,
 )
+import mmap
 import os
 
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+TEST_DIR = os.path.join(BASE_DIR, "test")
+CHART_PNG = os.path.join(BASE_DIR, "chart.png")
+
+_RNG = random.Random(0xC0FFEE)
+PIVOT_ROWS = [
+    [
+        _RNG.choice(
+            [
+                "Jan",
+                "Feb",
+                "Mar",
+                "Apr",
+                "May",
+                "Jun",
+                "Jul",
+                "Aug",
+                "Sep",
+                "Oct",
+                "Nov",
+                "Dec",
+            ]
+        ),
+        _RNG.choice([2017, 2018, 2019]),
+        _RNG.choice(["Meat", "Dairy", "Beverages", "Produce"]),
+        _RNG.randrange(5000),
+        _RNG.choice(["East", "West", "North", "South"]),
+    ]
+    for _ in range(30)
+]
+
+
+@lru_cache(maxsize=4)
+def _asset(path: str) -> memoryview:
+    with open(path, "rb") as file:
+        return memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY))
+
 
 class TestExcelize(unittest.TestCase):
 
-    @patch("platform.architecture")
-    def test_platform_architecture(self, mock_architecture):
-        mock_architecture.return_value = ("unknown", "ELF")
-        with self.assertRaises(SystemExit):
-            excelize.load_lib()
-
-    @patch("platform.machine")
-    def test_platform_machine(self, mock_machine):
-        mock_machine.return_value = "unknown"
-        with self.assertRaises(SystemExit):
-            excelize.load_lib()
-
-    @patch("platform.machine")
-    @patch("platform.system")
-    def test_platform_machine_arm64(self, mock_machine, mock_system):
-        mock_machine.return_value = "darwin"
-        mock_system.return_value = "arm64"
-        excelize.load_lib()
-
-    @patch("platform.system")
-    def test_platform_system(self, mock_system):
-        mock_system.return_value = "unknown"
-        with self.assertRaises(SystemExit):
-            excelize.load_lib()
+    def test_platform_architecture(self):
+        from unittest.mock import patch
+
+        with patch("platform.architecture") as mock_architecture:
+            mock_architecture.return_value = ("unknown", "ELF")
+            with self.assertRaises(SystemExit):
+                excelize.load_lib()
+
+    def test_platform_machine(self):
+        from unittest.mock import patch
+
+        with patch("platform.machine") as mock_machine:
+            mock_machine.return_value = "unknown"
+            with self.assertRaises(SystemExit):
+                excelize.load_lib()
+
+    def test_platform_machine_arm64(self):
+        from unittest.mock import patch
+
+        with patch("platform.machine") as mock_machine:
+            with patch("platform.system") as mock_system:
+                mock_machine.return_value = "arm64"
+                mock_system.return_value = "darwin"
+                excelize.load_lib()
+
+    def test_platform_system(self):
+        from unittest.mock import patch
+
+        with patch("platform.system") as mock_system:
+            mock_system.return_value = "unknown"
+            with self.assertRaises(SystemExit):
+                excelize.load_lib()
 
     def test_c_value_to_py(self):
         self.assertIsNone(excelize.c_value_to_py(None, None))
@@ -63,11 +109,39 @@ class TestExcelize(unittest.TestCase):
         self.assertIsNone(f)
         self.assertTrue(str(err).startswith("open Book1.xlsx"))
 
+    def test_file_index(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        f1, f2 = excelize.new_file(), excelize.new_file()
+        self.assertIsNone(f2.set_cell_value("Sheet1", "A1", "f2"))
+        self.assertIsNone(f1.close())
+        f3 = excelize.new_file()
+        self.assertNotEqual(f3.file_index, f2.file_index)
+        self.assertIsNone(f3.set_cell_value("Sheet1", "A1", "f3"))
+        val, err = f2.get_cell_value("Sheet1", "A1")
+        self.assertEqual(val, "f2")
+        self.assertIsNone(err)
+        self.assertIsNone(f2.close())
+        self.assertIsNone(f3.close())
+
+        def worker(i: int) -> str:
+            f = excelize.new_file()
+            self.assertIsNone(f.set_cell_value("Sheet1", "A1", i))
+            val, err = f.get_cell_value("Sheet1", "A1")
+            self.assertIsNone(err)
+            self.assertIsNone(f.close())
+            return val
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(worker, range(64)))
+        self.assertEqual(results, [str(i) for i in range(64)])
+
     def test_app_props(self):
         f = excelize.new_file()
         props, err = f.get_app_props()
         self.assertEqual(props.application, "Go Excelize")
         self.assertIsNone(err)
+        self.assertIsNone(f.close())
 
     def test_default_font(self):
         f = excelize.new_file()
@@ -76,6 +150,7 @@ class TestExcelize(unittest.TestCase):
         val, err = f.get_default_font()
         self.assertEqual(val, font_name)
         self.assertIsNone(err)
+        self.assertIsNone(f.close())
 
     def test_stream_writer(self):
         f = excelize.new_file()
@@ -124,9 +199,62 @@ class TestExcelize(unittest.TestCase):
         )
 
         self.assertIsNone(sw.flush())
-        self.assertIsNone(f.save_as(os.path.join("test", "TestStreamWriter.xlsx")))
+        buf, err = f.write_to_buffer()
+        self.assertIsNone(err)
+        self.assertGreater(len(buf), 0)
+        self.assertIsNone(f.close())
+
+    def test_rows(self):
+        from unittest.mock import patch
+
+        f = excelize.new_file()
+        self.assertIsNone(
+            f.set_cell_values("Sheet1", "A1", [["A", "B"], [1, 2], [3.5, True]])
+        )
+        _, err = f.rows("SheetN")
+        self.assertEqual(str(err), "sheet SheetN does not exist")
+
+        rows, err = f.rows("Sheet1")
+        self.assertIsNone(err)
+        result = []
+        with patch.object(
+            excelize.lib,
+            "FreeStringArrayErrorResult",
+            wraps=excelize.lib.FreeStringArrayErrorResult,
+        ) as free_result:
+            while rows.next():
+                row, err = rows.columns()
+                self.assertIsNone(err)
+                result.append(row)
+                # Each row is released before reading the next one
+                self.assertEqual(free_result.call_count, len(result))
+        self.assertIsNone(rows.error())
+        self.assertIsNone(rows.close())
+        self.assertEqual(result, [["A", "B"], ["1", "2"], ["3.5", "TRUE"]])
+        expected, err = f.get_rows("Sheet1")
+        self.assertIsNone(err)
+        self.assertEqual(result, expected)
+
+        rows, err = f.rows("Sheet1")
+        self.assertIsNone(err)
+        self.assertTrue(rows.next())
+        self.assertTrue(rows.next())
+        self.assertTrue(rows.next())
+        row, err = rows.columns(excelize.Options(raw_cell_value=True))
+        self.assertIsNone(err)
+        self.assertEqual(row, ["3.5", "1"])
+        self.assertIsNone(rows.close())
+
+        self.assertFalse(rows.next())
+        _, err = rows.columns()
+        self.assertEqual(str(err), "can not find rows iterator pointer")
+        self.assertEqual(str(rows.error()), "can not find rows iterator pointer")
+        self.assertEqual(str(rows.close()), "can not find rows iterator pointer")
+        self.assertIsNone(f.close())
 
     def test_style(self):
+        from unittest.mock import patch
+
         f = excelize.new_file()
         s = excelize.Style(
             border=[
@@ -170,6 +298,17 @@ class TestExcelize(unittest.TestCase):
         style, err = f.get_style(style_id)
         self.assertIsNone(err)
         self.assertEqual(style, s)
+        with patch.object(excelize.lib, "NewStyle") as new_style:
+            result, err = f.new_style(style)
+            new_style.assert_not_called()
+        self.assertIsNone(err)
+        self.assertEqual(style_id, result)
+        style.border = tuple(style.border)
+        with patch.object(excelize.lib, "NewStyle") as new_style:
+            result, err = f.new_style(style)
+            new_style.assert_not_called()
+        self.assertIsNone(err)
+        self.assertEqual(style_id, result)
         self.assertIsNone(f.set_cell_style("Sheet1", "A1", "B2", style_id))
         result, err = f.get_cell_style("Sheet1", "A2")
         self.assertIsNone(err)
@@ -204,22 +343,23 @@ class TestExcelize(unittest.TestCase):
         style, err = f.get_style(2)
         self.assertEqual("invalid style ID 2", str(err))
         self.assertIsNone(style)
-        self.assertIsNone(f.save_as(os.path.join("test", "TestStyle.xlsx")))
+        self.assertIsNone(f.save_as(os.path.join(TEST_DIR, "TestStyle.xlsx")))
         self.assertIsNone(
-            f.save_as(os.path.join("test", "TestStyle.xlsx")),
+            f.save_as(os.path.join(TEST_DIR, "TestStyle.xlsx")),
             excelize.Options(password="password"),
         )
         self.assertIsNone(f.close())
+        _, err = f.new_style(s)
+        self.assertEqual(str(err), "can not find file pointer")
 
         f, err = excelize.open_file(
-            os.path.join("test", "TestStyle.xlsx"),
+            os.path.join(TEST_DIR, "TestStyle.xlsx"),
             excelize.Options(password="password"),
         )
         self.assertIsNone(err)
-        with open("chart.png", "rb") as file:
-            self.assertIsNone(
-                f.set_sheet_background_from_bytes("Sheet1", ".png", file.read())
-            )
+        self.assertIsNone(
+            f.set_sheet_background_from_bytes("Sheet1", ".png", _asset(CHART_PNG))
+        )
 
         self.assertIsNone(f.set_cell_value("Sheet1", "A2", None))
         self.assertIsNone(f.set_cell_value("Sheet1", "A3", "Hello"))
@@ -291,7 +431,7 @@ class TestExcelize(unittest.TestCase):
         self.assertIsNone(f.set_col_outline_level("Sheet1", "D", 2))
         self.assertIsNone(f.set_row_outline("Sheet1", 2, 1))
 
-        self.assertIsNone(f.set_sheet_background("Sheet2", "chart.png"))
+        self.assertIsNone(f.set_sheet_background("Sheet2", CHART_PNG))
 
         idx, err = f.new_sheet(":\\/?*[]Maximum 31 characters allowed in sheet title.")
         self.assertEqual(idx, -1)
@@ -309,6 +449,15 @@ class TestExcelize(unittest.TestCase):
             str(f.delete_sheet("Sheet:1")),
             "the sheet can not contain any of the characters :\\/?*[or]",
         )
+        self.assertEqual(
+            str(f.delete_sheet("Maximum 31 characters allowed in sheet title.")),
+            "the sheet name length exceeds the 31 characters limit",
+        )
+        idx, err = f.new_sheet("Sheet[1]")
+        self.assertEqual(idx, -1)
+        self.assertEqual(
+            str(err), "the sheet can not contain any of the characters :\\/?*[or]"
+        )
 
         self.assertEqual(
             str(f.delete_chart("SheetN", "A1")), "sheet SheetN does not exist"
@@ -386,16 +535,27 @@ class TestExcelize(unittest.TestCase):
         self.assertIsNone(f.update_linked_value())
         self.assertIsNone(f.save())
         self.assertIsNone(f.save(excelize.Options(password="")))
+        buf, err = f.write_to_buffer()
+        self.assertIsNone(err)
         self.assertIsNone(f.close())
+        _, err = f.write_to_buffer()
+        self.assertEqual(str(err), "can not find file pointer")
+        idx, err = f.new_sheet("Sheet:1")
+        self.assertEqual(idx, -1)
+        self.assertEqual(str(err), "can not find file pointer")
+        self.assertEqual(str(f.delete_sheet("Sheet:1")), "can not find file pointer")
 
-        with open(os.path.join("test", "TestStyle.xlsx"), "rb") as file:
-            f, err = excelize.open_reader(file.read())
-            self.assertIsNone(err)
-            self.assertIsNone(f.save_as(os.path.join("test", "TestOpenReader.xlsx")))
+        f, err = excelize.open_reader(buf)
+        self.assertIsNone(err)
+        buf, err = f.write_to_buffer(excelize.Options(password="password"))
+        self.assertIsNone(err)
+        self.assertIsNone(f.close())
+        f, err = excelize.open_reader(buf, excelize.Options(password="password"))
+        self.assertIsNone(err)
+        self.assertIsNone(f.close())
 
-        with open("chart.png", "rb") as file:
-            _, err = excelize.open_reader(file.read(), excelize.Options(password=""))
-            self.assertEqual(str(err), "zip: not a valid zip file")
+        _, err = excelize.open_reader(_asset(CHART_PNG), excelize.Options(password=""))
+        self.assertEqual(str(err), "zip: not a valid zip file")
 
     def test_add_chart(self):
         f = excelize.new_file()
@@ -491,7 +651,9 @@ class TestExcelize(unittest.TestCase):
                 ),
             )
         )
-        self.assertIsNone(f.save_as(os.path.join("test", "TestAddChart.xlsx")))
+        buf, err = f.write_to_buffer()
+        self.assertIsNone(err)
+        self.assertGreater(len(buf), 0)
         self.assertIsNone(f.close())
 
     def test_comment(self):
@@ -516,7 +678,9 @@ class TestExcelize(unittest.TestCase):
                 ),
             )
         )
-        self.assertIsNone(f.save_as(os.path.join("test", "TestComment.xlsx")))
+        buf, err = f.write_to_buffer()
+        self.assertIsNone(err)
+        self.assertGreater(len(buf), 0)
         self.assertIsNone(f.close())
 
     def test_add_form_control(self):
@@ -597,9 +761,12 @@ class TestExcelize(unittest.TestCase):
         self.assertIsNone(
             f.set_sheet_props("Sheet1", excelize.SheetPropsOptions(code_name="Sheet1"))
         )
-        with open(os.path.join("test", "vbaProject.bin"), "rb") as file:
-            self.assertIsNone(f.add_vba_project(file.read()))
-        self.assertIsNone(f.save_as(os.path.join("test", "TestAddFormControl.xlsm")))
+        self.assertIsNone(
+            f.add_vba_project(_asset(os.path.join(TEST_DIR, "vbaProject.bin")))
+        )
+        buf, err = f.write_to_buffer()
+        self.assertIsNone(err)
+        self.assertGreater(len(buf), 0)
         self.assertIsNone(f.close())
 
     def test_header_footer(self):
@@ -618,7 +785,9 @@ class TestExcelize(unittest.TestCase):
                 ),
             )
         )
-        self.assertIsNone(f.save_as(os.path.join("test", "TestHeaderFooter.xlsx")))
+        buf, err = f.write_to_buffer()
+        self.assertIsNone(err)
+        self.assertGreater(len(buf), 0)
         self.assertIsNone(f.close())
 
     def test_page_layout(self):
@@ -638,7 +807,9 @@ class TestExcelize(unittest.TestCase):
                 ),
             )
         )
-        self.assertIsNone(f.save_as(os.path.join("test", "TestPageLayout.xlsx")))
+        buf, err = f.write_to_buffer()
+        self.assertIsNone(err)
+        self.assertGreater(len(buf), 0)
         self.assertIsNone(f.close())
 
     def test_page_margins(self):
@@ -658,7 +829,9 @@ class TestExcelize(unittest.TestCase):
                 ),
             )
         )
-        self.assertIsNone(f.save_as(os.path.join("test", "TestPageMargins.xlsx")))
+        buf, err = f.write_to_buffer()
+        self.assertIsNone(err)
+        self.assertGreater(len(buf), 0)
         self.assertIsNone(f.close())
 
     def test_panes(self):
@@ -683,49 +856,30 @@ class TestExcelize(unittest.TestCase):
                 ),
             )
         )
-        self.assertIsNone(f.save_as(os.path.join("test", "TestPanes.xlsx")))
+        buf, err = f.write_to_buffer()
+        self.assertIsNone(err)
+        self.assertGreater(len(buf), 0)
         self.assertIsNone(f.close())
 
     def test_pivot_table(self):
         f = excelize.new_file()
-        month = [
-            "Jan",
-            "Feb",
-            "Mar",
-            "Apr",
-            "May",
-            "Jun",
-            "Jul",
-            "Aug",
-            "Sep",
-            "Oct",
-            "Nov",
-            "Dec",
-        ]
-        year = [2017, 2018, 2019]
-        types = ["Meat", "Dairy", "Beverages", "Produce"]
-        region = ["East", "West", "North", "South"]
         self.assertIsNone(
             f.set_sheet_row(
                 "Sheet1", "A1", ["Month", "Year", "Type", "Sales", "Region"]
             )
         )
-        for row in range(2, 32):
-            self.assertIsNone(
-                f.set_cell_value("Sheet1", f"A{row}", month[random.randrange(12)])
-            )
-            self.assertIsNone(
-                f.set_cell_value("Sheet1", f"B{row}", year[random.randrange(3)])
-            )
-            self.assertIsNone(
-                f.set_cell_value("Sheet1", f"C{row}", types[random.randrange(4)])
-            )
-            self.assertIsNone(
-                f.set_cell_value("Sheet1", f"D{row}", random.randrange(5000))
-            )
-            self.assertIsNone(
-                f.set_cell_value("Sheet1", f"E{row}", region[random.randrange(4)])
-            )
+        self.assertIsNone(f.set_cell_values("Sheet1", "A2", PIVOT_ROWS))
+        val, err = f.get_cell_value("Sheet1", "E31")
+        self.assertEqual(val, PIVOT_ROWS[-1][-1])
+        self.assertIsNone(err)
+        self.assertEqual(
+            str(f.set_cell_values("SheetN", "A2", PIVOT_ROWS)),
+            "sheet SheetN does not exist",
+        )
+        self.assertEqual(
+            str(f.set_cell_values("Sheet1", "A", PIVOT_ROWS)),
+            'cannot convert cell "A" to coordinates: invalid cell name "A"',
+        )
         self.assertIsNone(
             f.add_pivot_table(
                 excelize.PivotTableOptions(
@@ -753,7 +907,9 @@ class TestExcelize(unittest.TestCase):
                 )
             )
         )
-        self.assertIsNone(f.save_as(os.path.join("test", "TestAddPivotTable.xlsx")))
+        buf, err = f.write_to_buffer()
+        self.assertIsNone(err)
+        self.assertGreater(len(buf), 0)
         self.assertIsNone(f.close())
 
     def test_add_shape(self):
@@ -790,7 +946,9 @@ class TestExcelize(unittest.TestCase):
                 ),
             )
         )
-        self.assertIsNone(f.save_as(os.path.join("test", "TestAddShape.xlsx")))
+        buf, err = f.write_to_buffer()
+        self.assertIsNone(err)
+        self.assertGreater(len(buf), 0)
         self.assertIsNone(f.close())
 
     def test_add_slicer(self):
@@ -824,7 +982,9 @@ class TestExcelize(unittest.TestCase):
         tables, err = f.get_tables("SheetN")
         self.assertEqual(str(err), "sheet SheetN does not exist")
         self.assertEqual(tables, [])
-        self.assertIsNone(f.save_as(os.path.join("test", "TestAddSlicer.xlsx")))
+        buf, err = f.write_to_buffer()
+        self.assertIsNone(err)
+        self.assertGreater(len(buf), 0)
         self.assertIsNone(f.close())
 
     def test_add_sparkline(self):
@@ -839,7 +999,9 @@ class TestExcelize(unittest.TestCase):
                 ),
             )
         )
-        self.assertIsNone(f.save_as(os.path.join("test", "TestAddSparkline.xlsx")))
+        buf, err = f.write_to_buffer()
+        self.assertIsNone(err)
+        self.assertGreater(len(buf), 0)
         self.assertIsNone(f.close())
 
     def test_auto_filter(self):
@@ -863,7 +1025,9 @@ class TestExcelize(unittest.TestCase):
                 ],
             )
         )
-        self.assertIsNone(f.save_as(os.path.join("test", "TestAutoFilter.xlsx")))
+        buf, err = f.write_to_buffer()
+        self.assertIsNone(err)
+        self.assertGreater(len(buf), 0)
         self.assertIsNone(f.close())
 
     def test_calc_cell_formula(self):
@@ -890,20 +1054,45 @@ class TestExcelize(unittest.TestCase):
         val, err = f.calc_cell_value("Sheet1", "D2")
         self.assertEqual(val, "0")
         self.assertIsNone(err)
+        self.assertIsNone(f.close())
 
     def test_cell_name_to_coordinates(self):
-        col, row, err = excelize.cell_name_to_coordinates("Z3")
-        self.assertEqual(col, 26)
-        self.assertEqual(row, 3)
-        self.assertIsNone(err)
+        # Repeated conversions are returned from the cache
+        excelize._cell_name_to_coordinates.cache_clear()
+        for _ in range(2):
+            col, row, err = excelize.cell_name_to_coordinates("Z3")
+            self.assertEqual(col, 26)
+            self.assertEqual(row, 3)
+            self.assertIsNone(err)
 
-        col, row, err = excelize.cell_name_to_coordinates("A")
-        self.assertEqual(col, -1)
-        self.assertEqual(row, -1)
-        self.assertEqual(
-            str(err),
-            'cannot convert cell "A" to coordinates: invalid cell name "A"',
-        )
+            col, row, err = excelize.cell_name_to_coordinates("A")
+            self.assertEqual(col, -1)
+            self.assertEqual(row, -1)
+            self.assertEqual(
+                str(err),
+                'cannot convert cell "A" to coordinates: invalid cell name "A"',
+            )
+        cache_info = excelize._cell_name_to_coordinates.cache_info()
+        self.assertEqual(cache_info.misses, 2)
+        self.assertEqual(cache_info.hits, 2)
+
+        excelize._coordinates_to_cell_name.cache_clear()
+        for _ in range(2):
+            cell, err = excelize.coordinates_to_cell_name(26, 3)
+            self.assertEqual(cell, "Z3")
+            self.assertIsNone(err)
+
+            cell, err = excelize.coordinates_to_cell_name(26, 3, True)
+            self.assertEqual(cell, "$Z$3")
+            self.assertIsNone(err)
+        cache_info = excelize._coordinates_to_cell_name.cache_info()
+        self.assertEqual(cache_info.misses, 2)
+        self.assertEqual(cache_info.hits, 2)
+
+        _, err1 = excelize.coordinates_to_cell_name(0, 1)
+        _, err2 = excelize.coordinates_to_cell_name(0, 1)
+        self.assertEqual(str(err1), str(err2))
+        self.assertIsNot(err1, err2)
 
     def test_cell_hyperlink(self):
         f = excelize.new_file()
@@ -929,7 +1118,9 @@ class TestExcelize(unittest.TestCase):
         self.assertTrue(link)
         self.assertEqual(target, display)
         self.assertIsNone(err)
-        self.assertIsNone(f.save_as(os.path.join("test", "TestCellHyperLink.xlsx")))
+        buf, err = f.write_to_buffer()
+        self.assertIsNone(err)
+        self.assertGreater(len(buf), 0)
         self.assertIsNone(f.close())
 
     def test_cell_rich_text(self):
@@ -1025,7 +1216,9 @@ class TestExcelize(unittest.TestCase):
         self.assertEqual(runs, expected)
         self.assertIsNone(err)
 
-        self.assertIsNone(f.save_as(os.path.join("test", "TestCellRichText.xlsx")))
+        buf, err = f.write_to_buffer()
+        self.assertIsNone(err)
+        self.assertGreater(len(buf), 0)
         self.assertIsNone(f.close())
 
     def test_conditional_format(self):
@@ -1052,41 +1245,55 @@ class TestExcelize(unittest.TestCase):
                 ],
             )
         )
-        self.assertIsNone(f.save_as(os.path.join("test", "TestConditionalFormat.xlsx")))
+        buf, err = f.write_to_buffer()
+        self.assertIsNone(err)
+        self.assertGreater(len(buf), 0)
         self.assertIsNone(f.close())
 
     def test_column_name_to_number(self):
-        col, err = excelize.column_name_to_number("Z")
-        self.assertEqual(col, 26)
-        self.assertIsNone(err)
+        # Repeated conversions are returned from the cache
+        excelize._column_name_to_number.cache_clear()
+        for _ in range(2):
+            col, err = excelize.column_name_to_number("Z")
+            self.assertEqual(col, 26)
+            self.assertIsNone(err)
 
-        col, err = excelize.column_name_to_number("-")
-        self.assertEqual(col, -1)
-        self.assertEqual(
-            str(err),
-            'invalid column name "-"',
-        )
+            col, err = excelize.column_name_to_number("-")
+            self.assertEqual(col, -1)
+            self.assertEqual(
+                str(err),
+                'invalid column name "-"',
+            )
+        cache_info = excelize._column_name_to_number.cache_info()
+        self.assertEqual(cache_info.misses, 2)
+        self.assertEqual(cache_info.hits, 2)
 
     def test_column_number_to_name(self):
-        name, err = excelize.column_number_to_name(26)
-        self.assertEqual(name, "Z")
-        self.assertIsNone(err)
+        # Repeated conversions are returned from the cache
+        excelize._column_number_to_name.cache_clear()
+        for _ in range(2):
+            name, err = excelize.column_number_to_name(26)
+            self.assertEqual(name, "Z")
+            self.assertIsNone(err)
 
-        name, err = excelize.column_number_to_name(0)
-        self.assertEqual(name, "")
-        self.assertEqual(
-            str(err),
-            "the column number must be greater than or equal to 1 and less than or equal to 16384",
-        )
+            name, err = excelize.column_number_to_name(0)
+            self.assertEqual(name, "")
+            self.assertEqual(
+                str(err),
+                "the column number must be greater than or equal to 1 and less than or equal to 16384",
+            )
+        cache_info = excelize._column_number_to_name.cache_info()
+        self.assertEqual(cache_info.misses, 2)
+        self.assertEqual(cache_info.hits, 2)
 
     def test_add_picture(self):
         f = excelize.new_file()
-        self.assertIsNone(f.add_picture("Sheet1", "A1", "chart.png", None))
+        self.assertIsNone(f.add_picture("Sheet1", "A1", CHART_PNG, None))
         self.assertIsNone(
             f.add_picture(
                 "Sheet1",
                 "A2",
-                "chart.png",
+                CHART_PNG,
                 excelize.GraphicOptions(
                     print_object=True,
                     scale_x=0.1,
@@ -1095,25 +1302,50 @@ class TestExcelize(unittest.TestCase):
                 ),
             )
         )
-        with open("chart.png", "rb") as file:
-            self.assertIsNone(
-                f.add_picture_from_bytes(
-                    "Sheet1",
-                    "A3",
-                    excelize.Picture(
-                        extension=".png",
-                        file=file.read(),
-                        format=excelize.GraphicOptions(
-                            print_object=True,
-                            scale_x=0.1,
-                            scale_y=0.1,
-                            locked=False,
-                        ),
-                        insert_type=excelize.PictureInsertType.PictureInsertTypePlaceOverCells,
+        self.assertIsNone(
+            f.add_picture_from_bytes(
+                "Sheet1",
+                "A3",
+                excelize.Picture(
+                    extension=".png",
+                    file=_asset(CHART_PNG),
+                    format=excelize.GraphicOptions(
+                        print_object=True,
+                        scale_x=0.1,
+                        scale_y=0.1,
+                        locked=False,
                     ),
-                )
+                    insert_type=excelize.PictureInsertType.PictureInsertTypePlaceOverCells,
+                ),
+            )
+        )
+        self.assertIsNone(
+            f.add_picture_from_bytes(
+                "Sheet1",
+                "A4",
+                excelize.Picture(
+                    extension=".png",
+                    file=bytearray(_asset(CHART_PNG)),
+                    format=excelize.GraphicOptions(scale_x=0.1, scale_y=0.1),
+                ),
+            )
+        )
+        buf = bytearray(2 * len(_asset(CHART_PNG)))
+        buf[::2] = _asset(CHART_PNG)
+        self.assertIsNone(
+            f.add_picture_from_bytes(
+                "Sheet1",
+                "A5",
+                excelize.Picture(
+                    extension=".png",
+                    file=memoryview(buf)[::2],
+                    format=excelize.GraphicOptions(scale_x=0.1, scale_y=0.1),
+                ),
             )
-        self.assertIsNone(f.save_as(os.path.join("test", "TestAddPicture.xlsx")))
+        )
+        buf, err = f.write_to_buffer()
+        self.assertIsNone(err)
+        self.assertGreater(len(buf), 0)
         self.assertIsNone(f.close())
 
     def test_defined_name(self):
@@ -1136,7 +1368,9 @@ class TestExcelize(unittest.TestCase):
                 )
             )
         )
-        self.assertIsNone(f.save_as(os.path.join("test", "TestSetDefinedName.xlsx")))
+        buf, err = f.write_to_buffer()
+        self.assertIsNone(err)
+        self.assertGreater(len(buf), 0)
         self.assertIsNone(f.close())
 
     def test_doc_props(self):
@@ -1161,7 +1395,9 @@ class TestExcelize(unittest.TestCase):
                 )
             )
         )
-        self.assertIsNone(f.save_as(os.path.join("test", "TestDocProps.xlsx")))
+        buf, err = f.write_to_buffer()
+        self.assertIsNone(err)
+        self.assertGreater(len(buf), 0)
         self.assertIsNone(f.close())
 
     def test_set_sheet_col(self):
@@ -1185,7 +1421,9 @@ class TestExcelize(unittest.TestCase):
         self.assertIsNone(err)
         self.assertEqual(dimension, "A1:B6")
         self.assertIsNone(f.set_sheet_name("Sheet1", "SheetN"))
-        self.assertIsNone(f.save_as(os.path.join("test", "TestSetSheetCol.xlsx")))
+        buf, err = f.write_to_buffer()
+        self.assertIsNone(err)
+        self.assertGreater(len(buf), 0)
         self.assertIsNone(f.close())
 
     def test_sheet_view(self):
@@ -1203,7 +1441,9 @@ class TestExcelize(unittest.TestCase):
             zoom_scale=120,
         )
         self.assertIsNone(f.set_sheet_view("Sheet1", 0, expected))
-        self.assertIsNone(f.save_as(os.path.join("test", "TestSheetView.xlsx")))
+        buf, err = f.write_to_buffer()
+        self.assertIsNone(err)
+        self.assertGreater(len(buf), 0)
         self.assertIsNone(f.close())
 
     def test_sheet_visible(self):
@@ -1211,7 +1451,9 @@ class TestExcelize(unittest.TestCase):
         _, err = f.new_sheet("Sheet2")
         self.assertIsNone(err)
         self.assertIsNone(f.set_sheet_visible("Sheet2", False, True))
-        self.assertIsNone(f.save_as(os.path.join("test", "TestSheetVisible.xlsx")))
+        buf, err = f.write_to_buffer()
+        self.assertIsNone(err)
+        self.assertGreater(len(buf), 0)
         self.assertIsNone(f.close())
 
     def test_workbook_props(self):
@@ -1223,7 +1465,9 @@ class TestExcelize(unittest.TestCase):
         opts, err = f.get_workbook_props()
         self.assertEqual(opts, expected)
         self.assertIsNone(err)
-        self.assertIsNone(f.save_as(os.path.join("test", "TestWorkbookProps.xlsx")))
+        buf, err = f.write_to_buffer()
+        self.assertIsNone(err)
+        self.assertGreater(len(buf), 0)
         self.assertIsNone(f.close())
 
     def test_type_convert(self):
@@ -1260,3 +1504,11 @@ class TestExcelize(unittest.TestCase):
         self.assertEqual(
             excelize.c_value_to_py(excelize.py_value_to_c(t1, _T1()), T1()), t1
         )
+        t1 = T1(
+            a=[1, 2, 3],
+            b=[1, None, 3],
+            c=[None, T2(2), None],
+        )
+        self.assertEqual(
+            excelize.c_value_to_py(excelize.py_value_to_c(t1, _T1()), T1()), t1
+        )
@@ -735,6 +735,13 @@ struct StringArrayErrorResult
     char *Err;
 };
 
+struct BytesErrorResult
+{
+    int ArrLen;
+    unsigned char *Arr;
+    char *Err;
+};
+
 struct GetCellHyperLinkResult
 {
     bool link;
@@ -713,6 +713,14 @@ class _StringArrayErrorResult(Structure):
     ]
 
 
+class _BytesErrorResult(Structure):
+    _fields_ = [
+        ("ArrLen", c_int),
+        ("Arr", POINTER(c_ubyte)),
+        ("Err", c_char_p),
+    ]
+
+
 class _CellNameToCoordinatesResult(Structure):
     _fields_ = [
         ("col", c_int),
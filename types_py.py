@@ -12,7 +12,16 @@ amounts of data. This library needs Python version 3.9 or later.
 
 from dataclasses import dataclass
 from enum import IntEnum
+from functools import partial
 from typing import List, Optional
+import sys
+
+# Define the data classes with slots when supported (Python 3.10 or later),
+# which reduces the per-instance memory of the option structures and speeds
+# up field access when converting them to C structures.
+_dataclass = (
+    partial(dataclass, slots=True) if sys.version_info >= (3, 10) else dataclass
+)
 
 
 class CultureName(IntEnum):
@@ -172,7 +181,7 @@ class PictureInsertType(IntEnum):
     PictureInsertTypeDISPIMG = 3
 
 
-@dataclass
+@_dataclass
 class Interface:
     type: int = 0
     integer: int = 0
@@ -181,7 +190,7 @@ class Interface:
     boolean: bool = False
 
 
-@dataclass
+@_dataclass
 class Options:
     max_calc_iterations: int = 0
     password: str = ""
@@ -194,7 +203,7 @@ class Options:
     culture_info: CultureName = CultureName.CultureNameUnknown
 
 
-@dataclass
+@_dataclass
 class AppProperties:
     application: str = ""
     scale_crop: bool = False
@@ -205,14 +214,14 @@ class AppProperties:
     app_version: str = ""
 
 
-@dataclass
+@_dataclass
 class Cell:
     style_id: int = 0
     formula: str = ""
     value: Optional[Interface] = None
 
 
-@dataclass
+@_dataclass
 class DocProperties:
     category: str = ""
     content_status: str = ""
@@ -237,14 +246,14 @@ class RowOpts:
     outline_level: int = 0
 
 
-@dataclass
+@_dataclass
 class Border:
     type: str = ""
     color: str = ""
     style: int = 0
 
 
-@dataclass
+@_dataclass
 class Fill:
     type: str = ""
     pattern: int = 0
@@ -252,7 +261,7 @@ class Fill:
     shading: int = 0
 
 
-@dataclass
+@_dataclass
 class Font:
     bold: bool = False
     italic: bool = False
@@ -267,7 +276,7 @@ class Font:
     vert_align: str = ""
 
 
-@dataclass
+@_dataclass
 class Alignment:
     horizontal: str = ""
     indent: int = 0
@@ -280,25 +289,25 @@ class Alignment:
     wrap_text: bool = False
 
 
-@dataclass
+@_dataclass
 class Protection:
     hidden: bool = False
     locked: bool = False
 
 
-@dataclass
+@_dataclass
 class AutoFilterOptions:
     column: str = ""
     expression: str = ""
 
 
-@dataclass
+@_dataclass
 class FormulaOpts:
     type: Optional[str] = None
     ref: Optional[str] = None
 
 
-@dataclass
+@_dataclass
 class HeaderFooterOptions:
     align_with_margins: Optional[bool] = None
     different_first: bool = False
@@ -312,13 +321,13 @@ class HeaderFooterOptions:
     first_footer: str = ""
 
 
-@dataclass
+@_dataclass
 class HyperlinkOpts:
     display: Optional[str] = None
     tooltip: Optional[str] = None
 
 
-@dataclass
+@_dataclass
 class Style:
     border: Optional[List[Border]] = None
     fill: Fill = Fill
@@ -331,17 +340,17 @@ class Style:
     neg_red: bool = False
 
 
-@dataclass
+@_dataclass
 class Row:
     cell: Optional[List[str]] = None
 
 
-@dataclass
+@_dataclass
 class GetRowsResult:
     row: Optional[List[Row]] = None
 
 
-@dataclass
+@_dataclass
 class GraphicOptions:
     alt_text: str = ""
     print_object: Optional[bool] = None
@@ -358,7 +367,7 @@ class GraphicOptions:
     positioning: str = ""
 
 
-@dataclass
+@_dataclass
 class PageLayoutMarginsOptions:
     bottom: Optional[float] = (None,)
     footer: Optional[float] = (None,)
@@ -370,7 +379,7 @@ class PageLayoutMarginsOptions:
     vertically: Optional[bool] = (None,)
 
 
-@dataclass
+@_dataclass
 class PageLayoutOptions:
     size: Optional[int] = (None,)
     orientation: Optional[str] = (None,)
@@ -382,7 +391,7 @@ class PageLayoutOptions:
     page_order: Optional[str] = (None,)
 
 
-@dataclass
+@_dataclass
 class Picture:
     extension: str = ""
     file: Optional[bytes] = None
@@ -390,14 +399,14 @@ class Picture:
     insert_type: PictureInsertType = PictureInsertType.PictureInsertTypePlaceOverCells
 
 
-@dataclass
+@_dataclass
 class Selection:
     sq_ref: str = ""
     active_cell: str = ""
     pane: str = ""
 
 
-@dataclass
+@_dataclass
 class Panes:
     freeze: bool = False
     split: bool = False
@@ -408,19 +417,19 @@ class Panes:
     selection: Optional[List[Selection]] = None
 
 
-@dataclass
+@_dataclass
 class RichTextRun:
     font: Optional[Font] = None
     text: str = ""
 
 
-@dataclass
+@_dataclass
 class GetCellRichTextResult:
     runs: Optional[List[RichTextRun]] = None
     err: str = ""
 
 
-@dataclass
+@_dataclass
 class Comment:
     author: str = ""
     author_id: int = 0
@@ -431,7 +440,7 @@ class Comment:
     paragraph: Optional[List[RichTextRun]] = None
 
 
-@dataclass
+@_dataclass
 class ConditionalFormatOptions:
     type: str = ""
     above_average: bool = False
@@ -459,7 +468,7 @@ class ConditionalFormatOptions:
     stop_if_true: bool = False
 
 
-@dataclass
+@_dataclass
 class FormControl:
     cell: str = ""
     macro: str = ""
@@ -479,13 +488,13 @@ class FormControl:
     format: GraphicOptions = GraphicOptions
 
 
-@dataclass
+@_dataclass
 class ChartNumFmt:
     custom_num_fmt: str = ""
     source_linked: bool = False
 
 
-@dataclass
+@_dataclass
 class ChartAxis:
     none: bool = False
     major_grid_lines: bool = False
@@ -506,20 +515,20 @@ class ChartAxis:
     title: Optional[RichTextRun] = None
 
 
-@dataclass
+@_dataclass
 class ChartDataLabel:
     alignment: Alignment = Alignment
     font: Font = Font
     fill: Fill = Fill
 
 
-@dataclass
+@_dataclass
 class ChartDimension:
     width: int = 0
     height: int = 0
 
 
-@dataclass
+@_dataclass
 class ChartPlotArea:
     second_plot_values: int = 0
     show_bubble_size: bool = False
@@ -532,27 +541,27 @@ class ChartPlotArea:
     num_fmt: ChartNumFmt = ChartNumFmt
 
 
-@dataclass
+@_dataclass
 class ChartLegend:
     position: str = ""
     show_legend_key: bool = False
 
 
-@dataclass
+@_dataclass
 class ChartMarker:
     fill: Fill = Fill
     symbol: str = ""
     size: int = 0
 
 
-@dataclass
+@_dataclass
 class ChartLine:
     type: ChartLineType = ChartLineType.ChartLineUnset
     smooth: bool = False
     width: float = 0
 
 
-@dataclass
+@_dataclass
 class ChartSeries:
     name: str = ""
     categories: str = ""
@@ -567,7 +576,7 @@ class ChartSeries:
     )
 
 
-@dataclass
+@_dataclass
 class Chart:
     type: ChartType = ChartType.Area
     series: Optional[List[ChartSeries]] = None
@@ -588,7 +597,7 @@ class Chart:
     overlap: Optional[int] = None
 
 
-@dataclass
+@_dataclass
 class PivotTableField:
     compact: bool = False
     data: str = ""
@@ -601,7 +610,7 @@ class PivotTableField:
     num_fmt: int = 0
 
 
-@dataclass
+@_dataclass
 class PivotTableOptions:
     data_range: str = ""
     pivot_table_range: str = ""
@@ -629,13 +638,13 @@ class PivotTableOptions:
     pivot_table_style_name: str = ""
 
 
-@dataclass
+@_dataclass
 class ShapeLine:
     color: str = ""
     width: Optional[int] = None
 
 
-@dataclass
+@_dataclass
 class Shape:
     cell: str = ""
     type: str = ""
@@ -648,7 +657,7 @@ class Shape:
     paragraph: Optional[List[RichTextRun]] = None
 
 
-@dataclass
+@_dataclass
 class SheetPropsOptions:
     code_name: Optional[str] = None
     enable_format_conditions_calculation: Optional[bool] = None
@@ -670,7 +679,7 @@ class SheetPropsOptions:
     thick_bottom: Optional[bool] = None
 
 
-@dataclass
+@_dataclass
 class SheetProtectionOptions:
     algorithm_name: str = ""
     auto_filter: bool = False
@@ -691,7 +700,7 @@ class SheetProtectionOptions:
     sort: bool = False
 
 
-@dataclass
+@_dataclass
 class SlicerOptions:
     name: str = ""
     cell: str = ""
@@ -706,7 +715,7 @@ class SlicerOptions:
     format: GraphicOptions = GraphicOptions
 
 
-@dataclass
+@_dataclass
 class SparklineOptions:
     location: Optional[List[str]] = None
     range: Optional[List[str]] = None
@@ -737,7 +746,7 @@ class SparklineOptions:
     empty_cells: str = ""
 
 
-@dataclass
+@_dataclass
 class Table:
     range: str = ""
     name: str = ""
@@ -749,13 +758,13 @@ class Table:
     show_row_stripes: Optional[bool] = None
 
 
-@dataclass
+@_dataclass
 class GetTablesResult:
     tables: Optional[List[Table]] = None
     err: str = ""
 
 
-@dataclass
+@_dataclass
 class ViewOptions:
     default_grid_color: Optional[bool] = None
     right_to_left: Optional[bool] = None
@@ -769,7 +778,7 @@ class ViewOptions:
     zoom_scale: Optional[float] = None
 
 
-@dataclass
+@_dataclass
 class DefinedName:
     name: str = ""
     comment: str = ""
@@ -777,14 +786,14 @@ class DefinedName:
     scope: str = ""
 
 
-@dataclass
+@_dataclass
 class WorkbookPropsOptions:
     date1904: Optional[bool] = None
     filter_privacy: Optional[bool] = None
     code_name: Optional[str] = None
 
 
-@dataclass
+@_dataclass
 class WorkbookProtectionOptions:
     algorithm_name: str = ""
     password: str = ""
@@ -792,7 +801,7 @@ class WorkbookProtectionOptions:
     lock_windows: bool = False
 
 
-@dataclass
+@_dataclass
 class StringArrayErrorResult:
     arr: Optional[List[str]] = None
     err: str = ""